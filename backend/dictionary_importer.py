@@ -6,7 +6,9 @@
 
 import asyncio
 import logging
+import queue
 import sys
+import threading
 import time
 from pathlib import Path
 from typing import Dict, Any, Optional, Callable
@@ -20,6 +22,9 @@ from dictionary_parser import DictionaryParser, scan_dictionary_files
 
 logger = logging.getLogger(__name__)
 
+# 所有异步导入共享的线程池，避免每次调用都创建并泄漏线程
+_IMPORT_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='dict-import')
+
 
 class DictionaryImporter:
     """词典导入器"""
@@ -30,6 +35,12 @@ class DictionaryImporter:
     # 进度更新间隔（条数）
     PROGRESS_UPDATE_INTERVAL = 5000
 
+    # 进度落库的最小时间间隔（秒），内存状态仍每批更新
+    PROGRESS_WRITE_INTERVAL = 1.0
+
+    # 解析线程与插入线程之间的批队列深度（限制在途批次的内存占用）
+    QUEUE_DEPTH = 4
+
     def __init__(self, db_path: Optional[str] = None):
         """
         初始化导入器
@@ -41,8 +52,12 @@ class DictionaryImporter:
             db_path = str(Path(__file__).parent.parent / 'database' / 'english_reading.db')
         self.db = DatabaseManager(db_path)
 
-        # 导入状态跟踪
+        # 导入状态跟踪（状态查询与后台导入线程并发访问，需加锁）
         self._import_tasks: Dict[int, Dict[str, Any]] = {}
+        self._tasks_lock = threading.Lock()
+
+        # 每个词典上次进度落库的时间戳（monotonic）
+        self._progress_write_ts: Dict[int, float] = {}
 
     def get_import_status(self, dictionary_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -55,8 +70,9 @@ class DictionaryImporter:
             导入状态信息
         """
         # 先检查内存中的任务状态
-        if dictionary_id in self._import_tasks:
-            return self._import_tasks[dictionary_id]
+        with self._tasks_lock:
+            if dictionary_id in self._import_tasks:
+                return dict(self._import_tasks[dictionary_id])
 
         # 从数据库获取
         dictionary = self.db.get_dictionary_by_id(dictionary_id)
@@ -112,50 +128,76 @@ class DictionaryImporter:
         )
 
         # 初始化任务状态
-        self._import_tasks[dictionary_id] = {
-            'dictionary_id': dictionary_id,
-            'status': 'importing',
-            'progress': 0.0,
-            'entry_count': 0,
-            'error': None,
-            'start_time': time.time()
-        }
+        with self._tasks_lock:
+            self._import_tasks[dictionary_id] = {
+                'dictionary_id': dictionary_id,
+                'status': 'importing',
+                'progress': 0.0,
+                'entry_count': 0,
+                'error': None,
+                'start_time': time.time()
+            }
 
         try:
-            # 创建解析器
-            parser = DictionaryParser.create_parser(file_path)
+            # 创建解析器（复用get_file_info已检测的编码，避免再次嗅探）
+            parser = DictionaryParser.create_parser(file_path, encoding=file_info['encoding'])
 
             # 获取总数（用于计算进度）
             total_count = parser.get_total_count()
             logger.info(f"开始导入词典 '{name}'，预计 {total_count} 条词条")
 
-            # 批量导入
-            batch = []
+            # 批量导入：解析线程生产批次，当前线程消费并写库，
+            # 使CPU密集的解析与SQLite提交的I/O相互重叠
+            batch_queue: queue.Queue = queue.Queue(maxsize=self.QUEUE_DEPTH)
+            producer_errors = []
+
+            def produce():
+                """解析词条并按批放入队列（预分配批缓冲区+写入游标）"""
+                try:
+                    batch_size = self.BATCH_SIZE
+                    batch = [None] * batch_size
+                    batch_len = 0
+                    for entry in parser.parse():
+                        batch[batch_len] = entry
+                        batch_len += 1
+                        if batch_len >= batch_size:
+                            batch_queue.put(batch)
+                            batch = [None] * batch_size
+                            batch_len = 0
+                    if batch_len:
+                        batch_queue.put(batch[:batch_len])
+                except Exception as e:
+                    producer_errors.append(e)
+                finally:
+                    batch_queue.put(None)  # 结束哨兵
+
+            producer = threading.Thread(target=produce, name='dict-parse', daemon=True)
+            producer.start()
+
             imported_count = 0
             last_progress_update = 0
 
-            for entry in parser.parse():
-                batch.append(entry)
+            while True:
+                batch = batch_queue.get()
+                if batch is None:
+                    break
 
-                if len(batch) >= self.BATCH_SIZE:
-                    # 批量插入
-                    self.db.add_dictionary_entries_batch(dictionary_id, batch)
-                    imported_count += len(batch)
-                    batch = []
+                # 批量插入
+                self.db.add_dictionary_entries_batch(dictionary_id, batch)
+                imported_count += len(batch)
 
-                    # 更新进度
-                    if imported_count - last_progress_update >= self.PROGRESS_UPDATE_INTERVAL:
-                        progress = min(imported_count / total_count, 0.99) if total_count > 0 else 0.5
-                        self._update_progress(dictionary_id, progress, imported_count)
-                        last_progress_update = imported_count
+                # 更新进度（imported_count以消费端为准）
+                if imported_count - last_progress_update >= self.PROGRESS_UPDATE_INTERVAL:
+                    progress = min(imported_count / total_count, 0.99) if total_count > 0 else 0.5
+                    self._update_progress(dictionary_id, progress, imported_count)
+                    last_progress_update = imported_count
 
-                        if progress_callback:
-                            progress_callback(dictionary_id, progress, imported_count)
+                    if progress_callback:
+                        progress_callback(dictionary_id, progress, imported_count)
 
-            # 插入剩余数据
-            if batch:
-                self.db.add_dictionary_entries_batch(dictionary_id, batch)
-                imported_count += len(batch)
+            producer.join()
+            if producer_errors:
+                raise producer_errors[0]
 
             # 完成导入
             self.db.update_import_progress(
@@ -165,14 +207,16 @@ class DictionaryImporter:
                 entry_count=imported_count
             )
 
-            self._import_tasks[dictionary_id].update({
-                'status': 'completed',
-                'progress': 1.0,
-                'entry_count': imported_count,
-                'end_time': time.time()
-            })
+            with self._tasks_lock:
+                self._import_tasks[dictionary_id].update({
+                    'status': 'completed',
+                    'progress': 1.0,
+                    'entry_count': imported_count,
+                    'end_time': time.time()
+                })
+                start_time = self._import_tasks[dictionary_id]['start_time']
 
-            elapsed = time.time() - self._import_tasks[dictionary_id]['start_time']
+            elapsed = time.time() - start_time
             logger.info(f"词典 '{name}' 导入完成，共 {imported_count} 条词条，耗时 {elapsed:.1f} 秒")
 
             if progress_callback:
@@ -192,27 +236,41 @@ class DictionaryImporter:
                 error=error_msg
             )
 
-            self._import_tasks[dictionary_id].update({
-                'status': 'failed',
-                'error': error_msg
-            })
+            with self._tasks_lock:
+                self._import_tasks[dictionary_id].update({
+                    'status': 'failed',
+                    'error': error_msg
+                })
 
             raise
 
     def _update_progress(self, dictionary_id: int, progress: float, entry_count: int):
-        """更新导入进度"""
-        self.db.update_import_progress(
-            dictionary_id,
-            progress=progress,
-            status='importing',
-            entry_count=entry_count
-        )
+        """
+        更新导入进度
 
-        if dictionary_id in self._import_tasks:
-            self._import_tasks[dictionary_id].update({
-                'progress': progress,
-                'entry_count': entry_count
-            })
+        内存状态每次都更新（供UI实时查询），数据库写入按时间节流，
+        避免长导入期间产生大量小UPDATE。
+        """
+        now = time.monotonic()
+        with self._tasks_lock:
+            if dictionary_id in self._import_tasks:
+                self._import_tasks[dictionary_id].update({
+                    'progress': progress,
+                    'entry_count': entry_count
+                })
+
+            last_write = self._progress_write_ts.get(dictionary_id, 0.0)
+            should_write = now - last_write >= self.PROGRESS_WRITE_INTERVAL
+            if should_write:
+                self._progress_write_ts[dictionary_id] = now
+
+        if should_write:
+            self.db.update_import_progress(
+                dictionary_id,
+                progress=progress,
+                status='importing',
+                entry_count=entry_count
+            )
 
     async def import_dictionary_async(
         self,
@@ -234,10 +292,34 @@ class DictionaryImporter:
             词典ID
         """
         loop = asyncio.get_event_loop()
-        executor = ThreadPoolExecutor(max_workers=1)
 
         return await loop.run_in_executor(
-            executor,
+            _IMPORT_EXECUTOR,
+            self.import_dictionary,
+            file_path,
+            name,
+            description,
+            priority,
+            None
+        )
+
+    def import_dictionary_background(
+        self,
+        file_path: str,
+        name: str,
+        description: str = '',
+        priority: int = 100
+    ):
+        """
+        在常驻导入线程池中后台导入词典
+
+        与FastAPI的BackgroundTasks不同，解析不占用请求服务的事件循环线程；
+        进度通过get_import_status从内存状态查询。
+
+        Returns:
+            concurrent.futures.Future
+        """
+        return _IMPORT_EXECUTOR.submit(
             self.import_dictionary,
             file_path,
             name,
@@ -259,8 +341,9 @@ class DictionaryImporter:
         result = self.db.delete_dictionary(dictionary_id)
 
         # 清理任务状态
-        if dictionary_id in self._import_tasks:
-            del self._import_tasks[dictionary_id]
+        with self._tasks_lock:
+            self._import_tasks.pop(dictionary_id, None)
+            self._progress_write_ts.pop(dictionary_id, None)
 
         return result > 0
 
@@ -6,16 +6,111 @@
 
 import csv
 import json
+from itertools import chain
+import mmap
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Generator, Any, Tuple
+from typing import Dict, List, Optional, Generator, Any, Tuple, Union
 import logging
-import chardet
+
+# orjson解析速度比stdlib json快数倍，不可用时退回stdlib
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+# ijson支持流式解析大JSON文件，内存占用与批大小而非文件大小成正比
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
 
+class DictionaryEntry:
+    """
+    解析出的单个词条
+
+    用__slots__代替字典：数百万在途词条时每条省去dict的存储开销，
+    下游按属性读取也比按键哈希查找更快。
+    """
+
+    __slots__ = ('word', 'translation', 'phonetic_uk', 'phonetic_us', 'pos',
+                 'definition', 'exchange', 'examples', 'tags', 'frequency',
+                 'collins_star', 'oxford_level', 'bnc_rank', 'frq_rank')
+
+    def __init__(self, word: str = '', translation: str = ''):
+        self.word = word
+        self.translation = translation
+        self.phonetic_uk = None
+        self.phonetic_us = None
+        self.pos = None
+        self.definition = None
+        self.exchange = None
+        self.examples = None
+        self.tags = None
+        self.frequency = None
+        self.collins_star = None
+        self.oxford_level = None
+        self.bnc_rank = None
+        self.frq_rank = None
+
+    def to_row(self, dictionary_id: int) -> Tuple:
+        """
+        转为dictionary_entries表的定位插入元组
+
+        列顺序与DatabaseManager.add_dictionary_entries_batch的INSERT
+        一致。JSON序列化在这里完成，开销落在解析线程而非写库线程。
+        """
+        pos = self.pos
+        if isinstance(pos, (list, dict)):
+            pos = json.dumps(pos, ensure_ascii=False)
+
+        exchange = self.exchange
+        if isinstance(exchange, (list, dict)):
+            exchange = json.dumps(exchange, ensure_ascii=False)
+
+        examples = self.examples
+        if isinstance(examples, (list, dict)):
+            examples = json.dumps(examples, ensure_ascii=False)
+
+        tags = self.tags
+        if isinstance(tags, (list, dict)):
+            tags = json.dumps(tags, ensure_ascii=False)
+
+        return (
+            dictionary_id,
+            self.word,
+            self.word.lower(),
+            self.translation,
+            self.phonetic_uk,
+            self.phonetic_us,
+            pos,
+            self.definition,
+            exchange,
+            examples,
+            tags,
+            self.frequency,
+            self.collins_star,
+            self.oxford_level,
+            self.bnc_rank,
+            self.frq_rank
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """转为字典（仅含非空字段），用于预览等JSON序列化场景"""
+        return {slot: value for slot in self.__slots__
+                if (value := getattr(self, slot)) is not None}
+
+    def __repr__(self) -> str:
+        return f"DictionaryEntry(word={self.word!r}, translation={self.translation!r})"
+
+
 class DictionaryParser:
     """词典解析器基类"""
 
@@ -41,13 +136,14 @@ class DictionaryParser:
             return 'json'
         elif ext == '.csv':
             # 检查是否是ECDICT格式
+            # ECDICT的标题列名都是ASCII，直接二进制读取前1KB做子串判断，
+            # 免去文本模式的解码开销
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    first_line = f.readline()
-                    # ECDICT的CSV有特定的列名
-                    if 'word' in first_line and 'translation' in first_line:
-                        if 'phonetic' in first_line or 'exchange' in first_line:
-                            return 'ecdict'
+                with open(file_path, 'rb') as f:
+                    head = f.read(1024)
+                if b'word' in head and b'translation' in head:
+                    if b'phonetic' in head or b'exchange' in head:
+                        return 'ecdict'
             except Exception:
                 pass
             return 'csv'
@@ -55,12 +151,35 @@ class DictionaryParser:
         return 'unknown'
 
     @staticmethod
-    def detect_encoding(file_path: str) -> str:
-        """检测文件编码"""
+    def detect_encoding(file_path: str, use_chardet: bool = False) -> str:
+        """
+        检测文件编码
+
+        默认用BOM检查 + UTF-8试解码，绝大多数词典文件是UTF-8，
+        无需chardet逐字节统计。use_chardet=True时回退到chardet检测。
+        """
         with open(file_path, 'rb') as f:
-            raw_data = f.read(10000)  # 读取前10KB用于检测
-            result = chardet.detect(raw_data)
-            return result.get('encoding', 'utf-8') or 'utf-8'
+            head = f.read(4096)
+
+        if head.startswith(b'\xef\xbb\xbf'):
+            return 'utf-8-sig'
+        if head.startswith(b'\xff\xfe') or head.startswith(b'\xfe\xff'):
+            return 'utf-16'
+
+        if use_chardet:
+            try:
+                import chardet
+                result = chardet.detect(head)
+                return result.get('encoding', 'utf-8') or 'utf-8'
+            except ImportError:
+                pass
+
+        try:
+            head.decode('utf-8')
+            return 'utf-8'
+        except UnicodeDecodeError:
+            # 非UTF-8时按中文词典常见的GB系编码处理
+            return 'gb18030'
 
     @staticmethod
     def get_file_info(file_path: str) -> Dict[str, Any]:
@@ -88,12 +207,36 @@ class DictionaryParser:
         }
 
     @staticmethod
-    def create_parser(file_path: str) -> 'DictionaryParser':
+    def get_file_info_fast(file_path: str) -> Dict[str, Any]:
+        """
+        获取词典文件信息（跳过编码检测）
+
+        目录扫描只需要格式和大小；编码等到真正解析时再检测，
+        避免为从未导入的文件做逐个open+嗅探。
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"文件不存在: {file_path}")
+
+        file_format = DictionaryParser.detect_format(file_path)
+        file_size = path.stat().st_size
+
+        return {
+            'path': str(path.absolute()),
+            'name': path.name,
+            'format': file_format,
+            'size': file_size,
+            'size_mb': round(file_size / (1024 * 1024), 2)
+        }
+
+    @staticmethod
+    def create_parser(file_path: str, encoding: Optional[str] = None) -> 'DictionaryParser':
         """
         根据文件格式创建对应的解析器
 
         Args:
             file_path: 文件路径
+            encoding: 已知的文件编码（如get_file_info已检测过），为None时自动检测
 
         Returns:
             对应格式的解析器实例
@@ -101,26 +244,27 @@ class DictionaryParser:
         file_format = DictionaryParser.detect_format(file_path)
 
         if file_format == 'ecdict':
-            return ECDICTParser(file_path)
+            return ECDICTParser(file_path, encoding)
         elif file_format == 'csv':
-            return CSVParser(file_path)
+            return CSVParser(file_path, encoding)
         elif file_format == 'json':
-            return JSONParser(file_path)
+            return JSONParser(file_path, encoding)
         elif file_format == 'mdx':
-            return MDXParser(file_path)
+            return MDXParser(file_path, encoding)
         else:
             raise ValueError(f"不支持的词典格式: {file_format}")
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, encoding: Optional[str] = None):
         self.file_path = file_path
-        self.encoding = self.detect_encoding(file_path)
+        self.encoding = encoding or self.detect_encoding(file_path)
+        self._total_count: Optional[int] = None  # 词条总数缓存
 
-    def parse(self) -> Generator[Dict[str, Any], None, None]:
+    def parse(self) -> Generator[DictionaryEntry, None, None]:
         """
         解析词典文件，返回词条生成器
 
         Yields:
-            词条字典，包含 word, translation 等字段
+            DictionaryEntry词条对象
         """
         raise NotImplementedError
 
@@ -128,13 +272,56 @@ class DictionaryParser:
         """获取词条总数（估算）"""
         raise NotImplementedError
 
+    def _estimate_line_count(self, sample_size: int = 1 << 20) -> int:
+        """
+        采样估算文件行数
+
+        读取文件开头约1MB统计行数，按文件大小等比放大，
+        避免仅为进度统计就完整扫描数百MB的词典文件。
+        """
+        file_size = os.path.getsize(self.file_path)
+        if file_size == 0:
+            return 0
+
+        with open(self.file_path, 'rb') as f:
+            sample = f.read(sample_size)
+
+        if not sample:
+            return 0
+
+        line_count = sample.count(b'\n')
+        if len(sample) >= file_size:
+            # 文件不超过采样窗口，行数是精确值
+            return line_count
+
+        return int(line_count * file_size / len(sample))
+
+    def _count_lines(self) -> int:
+        """
+        统计文件行数
+
+        mmap整个文件后分块调用bytes.count，换行统计走C层memchr，
+        远快于Python逐行迭代；mmap不可用（空文件、网络文件系统等）
+        时退回采样估算。
+        """
+        try:
+            with open(self.file_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    total = 0
+                    chunk = 1 << 20
+                    for offset in range(0, len(mm), chunk):
+                        total += mm[offset:offset + chunk].count(b'\n')
+                    return total
+        except (OSError, ValueError):
+            return self._estimate_line_count()
+
     def get_preview(self, count: int = 10) -> List[Dict[str, Any]]:
-        """获取前N条词条预览"""
+        """获取前N条词条预览（转为字典便于JSON序列化）"""
         entries = []
         for i, entry in enumerate(self.parse()):
             if i >= count:
                 break
-            entries.append(entry)
+            entries.append(entry.as_dict())
         return entries
 
 
@@ -169,10 +356,25 @@ class ECDICTParser(DictionaryParser):
         '1': 'lemma'      # 原形（另一种标记）
     }
 
-    def __init__(self, file_path: str):
-        super().__init__(file_path)
-
-    def _parse_exchange(self, exchange_str: str) -> Optional[Dict[str, str]]:
+    # parse需要定位的ECDICT列
+    COLUMNS = ('word', 'phonetic', 'definition', 'translation', 'pos',
+               'collins', 'oxford', 'tag', 'bnc', 'frq', 'exchange')
+
+    def __init__(self, file_path: str, encoding: Optional[str] = None):
+        super().__init__(file_path, encoding)
+        # 只读标题行一次，建立列名到位置的映射（缺失列记为-1）
+        self._col_idx = self._read_column_index()
+
+    def _read_column_index(self) -> Dict[str, int]:
+        """读取标题行，计算各已知列的位置索引"""
+        with open(self.file_path, 'r', encoding=self.encoding,
+                  errors='ignore', newline='') as f:
+            headers = next(csv.reader(f), [])
+        return {col: headers.index(col) if col in headers else -1
+                for col in self.COLUMNS}
+
+    def _parse_exchange(self, exchange_str: str,
+                        _get_type=EXCHANGE_TYPES.get) -> Optional[Dict[str, str]]:
         """
         解析词形变化字符串
 
@@ -181,102 +383,142 @@ class ECDICTParser(DictionaryParser):
 
         Returns:
             词形变化字典，如 {"past": "went", "done": "gone", ...}
+
+        _get_type通过默认参数绑定为局部变量，热循环中避免属性查找。
         """
         if not exchange_str:
             return None
 
         result = {}
-        parts = exchange_str.split('/')
-        for part in parts:
-            if ':' in part:
-                type_code, form = part.split(':', 1)
-                type_name = self.EXCHANGE_TYPES.get(type_code, type_code)
-                result[type_name] = form
+        for part in exchange_str.split('/'):
+            type_code, sep, form = part.partition(':')
+            if sep:
+                result[_get_type(type_code, type_code)] = form
 
-        return result if result else None
+        return result or None
 
     def _parse_tags(self, tag_str: str) -> Optional[List[str]]:
         """解析标签字符串"""
         if not tag_str:
             return None
-        # 标签可能用空格分隔
-        tags = [t.strip().upper() for t in tag_str.split() if t.strip()]
-        return tags if tags else None
+        # 标签用空格分隔；split()已去除空白，无需再strip
+        tags = [t.upper() for t in tag_str.split()]
+        return tags or None
+
+    def _sample_has_quotes(self) -> bool:
+        """检查文件开头采样是否包含引号，用于决定是否直接走完整csv解析"""
+        with open(self.file_path, 'rb') as f:
+            return b'"' in f.read(1 << 20)
+
+    @staticmethod
+    def _fast_rows(f) -> Generator[List[str], None, None]:
+        """
+        无引号场景的快速行分割
+
+        绝大多数ECDICT行不含引号，直接str.split比csv模块的
+        逐字段状态机快得多。流中一旦出现引号，把当前行连同文件
+        剩余部分整体移交csv.reader——带引号的字段可能含逗号甚至
+        跨多行，逐行解析无法正确还原。
+        """
+        for line in f:
+            if '"' in line:
+                yield from csv.reader(chain((line,), f))
+                return
+            yield line.rstrip('\r\n').split(',')
 
-    def parse(self) -> Generator[Dict[str, Any], None, None]:
+    def parse(self) -> Generator[DictionaryEntry, None, None]:
         """解析ECDICT CSV文件"""
-        with open(self.file_path, 'r', encoding=self.encoding, errors='ignore') as f:
-            reader = csv.DictReader(f)
+        # 用csv.reader + 位置索引代替DictReader，避免每行构建字典和多次哈希查找
+        idx = self._col_idx
+        wi = idx['word']
+        ti = idx['translation']
+        pi = idx['phonetic']
+        di = idx['definition']
+        psi = idx['pos']
+        ci = idx['collins']
+        oi = idx['oxford']
+        tgi = idx['tag']
+        bi = idx['bnc']
+        fi = idx['frq']
+        ei = idx['exchange']
+
+        # 绑定为局部变量，循环内LOAD_FAST代替每行的属性+方法查找
+        parse_exchange = self._parse_exchange
+        parse_tags = self._parse_tags
+
+        with open(self.file_path, 'r', encoding=self.encoding,
+                  errors='ignore', newline='') as f:
+            if self._sample_has_quotes():
+                # 采样含引号：可能有跨行/含逗号的字段，走完整csv解析
+                reader = csv.reader(f)
+                next(reader, None)  # 跳过标题行
+            else:
+                next(f, None)  # 跳过标题行
+                reader = self._fast_rows(f)
 
             for row in reader:
-                word = row.get('word', '').strip()
-                translation = row.get('translation', '').strip()
+                n = len(row)
+                word = row[wi].strip() if 0 <= wi < n else ''
+                translation = row[ti].strip() if 0 <= ti < n else ''
 
                 # 跳过无效词条
                 if not word or not translation:
                     continue
 
-                entry = {
-                    'word': word,
-                    'translation': translation,
-                }
+                entry = DictionaryEntry(word, translation)
 
                 # 音标
-                phonetic = row.get('phonetic', '').strip()
+                phonetic = row[pi].strip() if 0 <= pi < n else ''
                 if phonetic:
-                    entry['phonetic_uk'] = phonetic
+                    entry.phonetic_uk = phonetic
 
                 # 英文释义
-                definition = row.get('definition', '').strip()
+                definition = row[di].strip() if 0 <= di < n else ''
                 if definition:
-                    entry['definition'] = definition
+                    entry.definition = definition
 
                 # 词性
-                pos = row.get('pos', '').strip()
+                pos = row[psi].strip() if 0 <= psi < n else ''
                 if pos:
-                    entry['pos'] = pos
+                    entry.pos = pos
 
                 # 柯林斯星级
-                collins = row.get('collins', '').strip()
+                collins = row[ci].strip() if 0 <= ci < n else ''
                 if collins and collins.isdigit():
-                    entry['collins_star'] = int(collins)
+                    entry.collins_star = int(collins)
 
                 # 牛津核心词汇
-                oxford = row.get('oxford', '').strip()
+                oxford = row[oi].strip() if 0 <= oi < n else ''
                 if oxford == '1':
-                    entry['oxford_level'] = 'core'
+                    entry.oxford_level = 'core'
 
                 # 标签
-                tags = self._parse_tags(row.get('tag', ''))
+                tags = parse_tags(row[tgi] if 0 <= tgi < n else '')
                 if tags:
-                    entry['tags'] = tags
+                    entry.tags = tags
 
                 # BNC词频排名
-                bnc = row.get('bnc', '').strip()
+                bnc = row[bi].strip() if 0 <= bi < n else ''
                 if bnc and bnc.isdigit():
-                    entry['bnc_rank'] = int(bnc)
+                    entry.bnc_rank = int(bnc)
 
                 # 当代语料库词频排名
-                frq = row.get('frq', '').strip()
+                frq = row[fi].strip() if 0 <= fi < n else ''
                 if frq and frq.isdigit():
-                    entry['frq_rank'] = int(frq)
+                    entry.frq_rank = int(frq)
 
                 # 词形变化
-                exchange = self._parse_exchange(row.get('exchange', ''))
+                exchange = parse_exchange(row[ei] if 0 <= ei < n else '')
                 if exchange:
-                    entry['exchange'] = exchange
+                    entry.exchange = exchange
 
                 yield entry
 
     def get_total_count(self) -> int:
-        """获取词条总数"""
-        count = 0
-        with open(self.file_path, 'r', encoding=self.encoding, errors='ignore') as f:
-            # 跳过标题行
-            next(f, None)
-            for _ in f:
-                count += 1
-        return count
+        """获取词条总数（扣除标题行）"""
+        if self._total_count is None:
+            self._total_count = max(self._count_lines() - 1, 0)
+        return self._total_count
 
 
 class CSVParser(DictionaryParser):
@@ -295,9 +537,15 @@ class CSVParser(DictionaryParser):
     PHONETIC_COLUMNS = ['phonetic', '音标', 'pronunciation']
     DEFINITION_COLUMNS = ['definition', '英文释义', 'english_definition']
 
-    def __init__(self, file_path: str):
-        super().__init__(file_path)
-        self.column_mapping = {}
+    def __init__(self, file_path: str, encoding: Optional[str] = None):
+        super().__init__(file_path, encoding)
+        # 只读标题行一次，建立列名映射和位置索引（缺失列记为-1）
+        with open(self.file_path, 'r', encoding=self.encoding,
+                  errors='ignore', newline='') as f:
+            headers = next(csv.reader(f), [])
+        self.column_mapping = self._detect_columns(headers)
+        self._col_idx = {field: headers.index(header)
+                         for field, header in self.column_mapping.items()}
 
     def _detect_columns(self, headers: List[str]) -> Dict[str, str]:
         """检测列名映射"""
@@ -316,50 +564,49 @@ class CSVParser(DictionaryParser):
 
         return mapping
 
-    def parse(self) -> Generator[Dict[str, Any], None, None]:
+    def parse(self) -> Generator[DictionaryEntry, None, None]:
         """解析CSV文件"""
-        with open(self.file_path, 'r', encoding=self.encoding, errors='ignore') as f:
-            reader = csv.DictReader(f)
+        if 'word' not in self._col_idx or 'translation' not in self._col_idx:
+            raise ValueError("CSV文件必须包含单词和翻译列")
 
-            # 检测列名映射
-            if reader.fieldnames:
-                self.column_mapping = self._detect_columns(reader.fieldnames)
+        idx = self._col_idx
+        wi = idx['word']
+        ti = idx['translation']
+        pi = idx.get('phonetic', -1)
+        di = idx.get('definition', -1)
 
-            if 'word' not in self.column_mapping or 'translation' not in self.column_mapping:
-                raise ValueError("CSV文件必须包含单词和翻译列")
+        with open(self.file_path, 'r', encoding=self.encoding,
+                  errors='ignore', newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # 跳过标题行
 
             for row in reader:
-                word = row.get(self.column_mapping['word'], '').strip()
-                translation = row.get(self.column_mapping['translation'], '').strip()
+                n = len(row)
+                word = row[wi].strip() if wi < n else ''
+                translation = row[ti].strip() if ti < n else ''
 
                 if not word or not translation:
                     continue
 
-                entry = {
-                    'word': word,
-                    'translation': translation,
-                }
+                entry = DictionaryEntry(word, translation)
 
-                if 'phonetic' in self.column_mapping:
-                    phonetic = row.get(self.column_mapping['phonetic'], '').strip()
+                if 0 <= pi < n:
+                    phonetic = row[pi].strip()
                     if phonetic:
-                        entry['phonetic_uk'] = phonetic
+                        entry.phonetic_uk = phonetic
 
-                if 'definition' in self.column_mapping:
-                    definition = row.get(self.column_mapping['definition'], '').strip()
+                if 0 <= di < n:
+                    definition = row[di].strip()
                     if definition:
-                        entry['definition'] = definition
+                        entry.definition = definition
 
                 yield entry
 
     def get_total_count(self) -> int:
-        """获取词条总数"""
-        count = 0
-        with open(self.file_path, 'r', encoding=self.encoding, errors='ignore') as f:
-            next(f, None)  # 跳过标题行
-            for _ in f:
-                count += 1
-        return count
+        """获取词条总数（扣除标题行）"""
+        if self._total_count is None:
+            self._total_count = max(self._count_lines() - 1, 0)
+        return self._total_count
 
 
 class JSONParser(DictionaryParser):
@@ -371,59 +618,103 @@ class JSONParser(DictionaryParser):
     2. 对象格式: {"hello": "你好", "world": "世界", ...}
     """
 
-    def __init__(self, file_path: str):
-        super().__init__(file_path)
+    def __init__(self, file_path: str, encoding: Optional[str] = None):
+        super().__init__(file_path, encoding)
+        self._data: Optional[Union[list, dict]] = None
+
+    def _load_data(self) -> Union[list, dict]:
+        """加载并缓存JSON数据，parse与get_total_count共享一次解析"""
+        if self._data is None:
+            with open(self.file_path, 'rb') as f:
+                raw = f.read()
+            try:
+                self._data = _json_loads(raw)
+            except ValueError:
+                # 含非法字节时退回按检测编码宽松解码
+                self._data = json.loads(raw.decode(self.encoding, errors='ignore'))
+        return self._data
+
+    def _peek_first_byte(self) -> bytes:
+        """读取文件第一个非空白字节，用于判断JSON顶层结构"""
+        with open(self.file_path, 'rb') as f:
+            while True:
+                chunk = f.read(4096)
+                if not chunk:
+                    return b''
+                stripped = chunk.lstrip()
+                if stripped:
+                    return stripped[:1]
+
+    @staticmethod
+    def _entry_from_item(item: Dict[str, Any]) -> Optional[DictionaryEntry]:
+        """从数组元素构建词条"""
+        word = item.get('word', '').strip()
+        translation = item.get('translation', item.get('trans', '')).strip()
+
+        if not word or not translation:
+            return None
+
+        entry = DictionaryEntry(word, translation)
+
+        # 复制其他字段
+        for key in ['phonetic_uk', 'phonetic_us', 'phonetic', 'pos',
+                   'definition', 'exchange', 'examples', 'tags']:
+            if key in item and item[key]:
+                if key == 'phonetic':
+                    entry.phonetic_uk = item[key]
+                else:
+                    setattr(entry, key, item[key])
 
-    def parse(self) -> Generator[Dict[str, Any], None, None]:
+        return entry
+
+    def parse(self) -> Generator[DictionaryEntry, None, None]:
         """解析JSON文件"""
-        with open(self.file_path, 'r', encoding=self.encoding, errors='ignore') as f:
-            data = json.load(f)
+        # 数组格式且ijson可用时流式解析，峰值内存与文件大小无关
+        if ijson is not None and self._peek_first_byte() == b'[':
+            with open(self.file_path, 'rb') as f:
+                for item in ijson.items(f, 'item'):
+                    if isinstance(item, dict):
+                        entry = self._entry_from_item(item)
+                        if entry:
+                            yield entry
+            return
+
+        data = self._load_data()
 
         if isinstance(data, list):
             # 数组格式
             for item in data:
                 if isinstance(item, dict):
-                    word = item.get('word', '').strip()
-                    translation = item.get('translation', item.get('trans', '')).strip()
-
-                    if word and translation:
-                        entry = {'word': word, 'translation': translation}
-
-                        # 复制其他字段
-                        for key in ['phonetic_uk', 'phonetic_us', 'phonetic', 'pos',
-                                   'definition', 'exchange', 'examples', 'tags']:
-                            if key in item and item[key]:
-                                if key == 'phonetic':
-                                    entry['phonetic_uk'] = item[key]
-                                else:
-                                    entry[key] = item[key]
-
+                    entry = self._entry_from_item(item)
+                    if entry:
                         yield entry
 
         elif isinstance(data, dict):
             # 对象格式: {"word": "translation"}
             for word, value in data.items():
                 if isinstance(value, str):
-                    yield {'word': word, 'translation': value}
+                    yield DictionaryEntry(word, value)
                 elif isinstance(value, dict):
                     translation = value.get('translation', value.get('trans', ''))
                     if translation:
-                        entry = {'word': word, 'translation': translation}
+                        entry = DictionaryEntry(word, translation)
                         for key in ['phonetic_uk', 'phonetic_us', 'pos', 'definition']:
                             if key in value:
-                                entry[key] = value[key]
+                                setattr(entry, key, value[key])
                         yield entry
 
-    def get_total_count(self) -> int:
-        """获取词条总数"""
-        with open(self.file_path, 'r', encoding=self.encoding, errors='ignore') as f:
-            data = json.load(f)
+        # 解析完成后释放缓存，避免大文件常驻内存
+        self._data = None
 
-        if isinstance(data, list):
-            return len(data)
-        elif isinstance(data, dict):
-            return len(data)
-        return 0
+    def get_total_count(self) -> int:
+        """获取词条总数（流式解析时返回0表示未知）"""
+        if self._total_count is None:
+            if ijson is not None and self._peek_first_byte() == b'[':
+                # 流式模式下不为统计数量而完整解析一遍
+                self._total_count = 0
+            else:
+                self._total_count = len(self._load_data())
+        return self._total_count
 
 
 class MDXParser(DictionaryParser):
@@ -434,8 +725,8 @@ class MDXParser(DictionaryParser):
     需要 readmdict 库来解析。
     """
 
-    def __init__(self, file_path: str):
-        super().__init__(file_path)
+    def __init__(self, file_path: str, encoding: Optional[str] = None):
+        super().__init__(file_path, encoding)
         self._mdx = None
 
     def _load_mdx(self):
@@ -449,6 +740,12 @@ class MDXParser(DictionaryParser):
             except Exception as e:
                 raise ValueError(f"无法解析MDX文件: {e}")
 
+    # 预编译的HTML清理正则（每个词条都会调用，避免重复编译和多次遍历）
+    _TAG_RE = re.compile(r'<[^>]+>')
+    _WS_RE = re.compile(r'\s+')
+    _ENTITY_RE = re.compile(r'&(nbsp|lt|gt|amp|quot);')
+    _ENTITY_MAP = {'nbsp': ' ', 'lt': '<', 'gt': '>', 'amp': '&', 'quot': '"'}
+
     def _clean_html(self, html_content: str) -> str:
         """
         清理HTML内容，提取纯文本
@@ -459,44 +756,42 @@ class MDXParser(DictionaryParser):
             return ''
 
         # 移除HTML标签
-        text = re.sub(r'<[^>]+>', ' ', html_content)
-        # 处理HTML实体
-        text = text.replace('&nbsp;', ' ')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&quot;', '"')
+        text = self._TAG_RE.sub(' ', html_content)
+        # 处理HTML实体（单次遍历替换全部实体）
+        text = self._ENTITY_RE.sub(lambda m: self._ENTITY_MAP[m.group(1)], text)
         # 清理多余空白
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = self._WS_RE.sub(' ', text).strip()
 
         return text
 
+    # 常见音标格式: [音标] / /音标/ / 【音标】，合并为单个预编译正则
+    _PHONETIC_RE = re.compile(r'\[([^\]]+)\]|/([^/]+)/|【([^】]+)】')
+    _IPA_CHARS = frozenset('əɪʊæɑɔʌɛɜːˈˌ')
+
     def _extract_phonetic(self, content: str) -> Optional[str]:
-        """从内容中提取音标"""
-        # 尝试匹配常见的音标格式
-        patterns = [
-            r'\[([^\]]+)\]',  # [音标]
-            r'/([^/]+)/',     # /音标/
-            r'【([^】]+)】',   # 【音标】
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, content)
-            if match:
-                phonetic = match.group(1).strip()
-                # 验证是否像音标（包含音标字符）
-                if any(c in phonetic for c in 'əɪʊæɑɔʌɛɜːˈˌ'):
-                    return phonetic
+        """从内容中提取音标
+
+        逐个候选校验而非只看首个匹配：内容里先出现的括号段未必是
+        音标（如"[2023] /həˈləʊ/"），返回第一个通过IPA字符校验的。
+        """
+        ipa_chars = self._IPA_CHARS
+        for match in self._PHONETIC_RE.finditer(content):
+            phonetic = (match.group(1) or match.group(2) or match.group(3)).strip()
+            # 验证是否像音标（包含音标字符）
+            if any(c in ipa_chars for c in phonetic):
+                return phonetic
 
         return None
 
-    def parse(self) -> Generator[Dict[str, Any], None, None]:
+    def parse(self) -> Generator[DictionaryEntry, None, None]:
         """解析MDX文件"""
         self._load_mdx()
 
         items = self._mdx.items()
+        item_count = 0
 
         for word_bytes, content_bytes in items:
+            item_count += 1
             try:
                 # 解码
                 word = word_bytes.decode('utf-8') if isinstance(word_bytes, bytes) else str(word_bytes)
@@ -511,15 +806,12 @@ class MDXParser(DictionaryParser):
                 if not translation:
                     continue
 
-                entry = {
-                    'word': word,
-                    'translation': translation[:2000],  # 限制长度
-                }
+                entry = DictionaryEntry(word, translation[:2000])  # 限制长度
 
                 # 尝试提取音标
                 phonetic = self._extract_phonetic(content)
                 if phonetic:
-                    entry['phonetic_uk'] = phonetic
+                    entry.phonetic_uk = phonetic
 
                 yield entry
 
@@ -527,10 +819,25 @@ class MDXParser(DictionaryParser):
                 logger.warning(f"解析MDX词条失败: {e}")
                 continue
 
+        # 顺便记下词条总数，后续get_total_count无需再扫描key区
+        self._total_count = item_count
+
     def get_total_count(self) -> int:
         """获取词条总数"""
+        if self._total_count is not None:
+            return self._total_count
+
         self._load_mdx()
-        return len(list(self._mdx.keys()))
+
+        # readmdict在解析头部时已记录词条数，优先直接读取
+        num_entries = getattr(self._mdx, '_num_entries', None)
+        if num_entries is not None:
+            self._total_count = int(num_entries)
+            return self._total_count
+
+        # 兜底：迭代计数，不materialize整个key列表
+        self._total_count = sum(1 for _ in self._mdx.keys())
+        return self._total_count
 
 
 def scan_dictionary_files(directory: str) -> List[Dict[str, Any]]:
@@ -550,13 +857,22 @@ def scan_dictionary_files(directory: str) -> List[Dict[str, Any]]:
     if not dir_path.exists():
         return files
 
-    for file_path in dir_path.iterdir():
-        if file_path.is_file() and file_path.suffix.lower() in supported_extensions:
+    candidates = [p for p in dir_path.iterdir()
+                  if p.is_file() and p.suffix.lower() in supported_extensions]
+    if not candidates:
+        return files
+
+    # 每个文件的stat+格式嗅探都是独立I/O，用线程池并发执行；
+    # 编码检测推迟到实际解析时进行
+    max_workers = min(8, (os.cpu_count() or 4) * 2, len(candidates))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(DictionaryParser.get_file_info_fast, str(p)): p
+                   for p in candidates}
+        for future in as_completed(futures):
             try:
-                info = DictionaryParser.get_file_info(str(file_path))
-                files.append(info)
+                files.append(future.result())
             except Exception as e:
-                logger.warning(f"获取文件信息失败 {file_path}: {e}")
+                logger.warning(f"获取文件信息失败 {futures[future]}: {e}")
 
     # 按文件名排序
     files.sort(key=lambda x: x['name'].lower())
@@ -3,14 +3,42 @@
 提供文本分析、句子分割、词性标注、命名实体识别等功能
 """
 
+import asyncio
+import bisect
+import hashlib
+import math
 import os
 import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+
+from fastapi.responses import StreamingResponse
+
+# 可选依赖：orjson（Rust实现的JSON编码器），长文档的token列表序列化快3~10倍
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as _DefaultJSONResponse
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    import json as _stdlib_json
+    from fastapi.responses import JSONResponse as _DefaultJSONResponse
+
+    def _json_dumps(obj) -> bytes:
+        return _stdlib_json.dumps(obj, ensure_ascii=False).encode("utf-8")
 from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union, Literal
 import spacy
+from spacy.attrs import POS, TAG, LEMMA, IS_ALPHA, IS_STOP, IDX, IS_SPACE
+from spacy.parts_of_speech import NAMES as _POS_NAMES
+from spacy.tokens import Doc
 import logging
 from contextlib import asynccontextmanager
 
@@ -24,33 +52,344 @@ logger = logging.getLogger(__name__)
 # 全局变量存储spaCy模型
 nlp_model = None
 
+# /sentences专用的轻量管道：纯规则sentencizer，不跑tok2vec/parser神经
+# 组件，分句吞吐比完整管道高一个数量级以上（边界规则略有差异，对常规
+# 英文文本结果一致）
+nlp_sents = None
+
+# 可通过环境变量NLP_MODEL切换模型包（如量化/裁剪后的本地包），API保持不变
+NLP_MODEL_NAME = os.getenv("NLP_MODEL", "en_core_web_sm")
+
+# NLP_DEVICE: auto（默认，有GPU则用）| gpu（强制，缺GPU时启动失败）| cpu
+NLP_DEVICE = os.getenv("NLP_DEVICE", "auto").lower()
+
+
+def _setup_device() -> None:
+    """在加载模型前按NLP_DEVICE选择计算设备"""
+    if NLP_DEVICE == "cpu":
+        return
+    if NLP_DEVICE == "gpu":
+        spacy.require_gpu()
+        logger.info("spaCy运行于GPU")
+        return
+    if spacy.prefer_gpu():
+        logger.info("检测到GPU，spaCy运行于GPU")
+
+# NLP批处理队列：并发请求的文本合并为一次nlp.pipe调用，
+# 分摊spaCy管道的每次调用开销
+NLP_BATCH_SIZE = 32
+nlp_queue: Optional[asyncio.Queue] = None
+
+# Doc缓存：按文本哈希缓存序列化的Doc字节，重复文本（翻页、重读）直接命中，
+# 免去重新跑整条NLP管道。可通过环境变量NLP_DOC_CACHE_SIZE调整，设为0禁用
+DOC_CACHE_SIZE = int(os.getenv("NLP_DOC_CACHE_SIZE", "1024"))
+_doc_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+
+# 可选依赖：Redis跨worker共享Doc缓存。配置REDIS_URL且可连通时，
+# 多个uvicorn worker共用一份缓存（命中率与请求落在哪个worker无关）；
+# 否则退回各进程自己的LRU
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+REDIS_URL = os.getenv("REDIS_URL", "")
+REDIS_DOC_TTL = 3600  # 秒
+_redis_client = None
+
+# 缓存命中率统计（每1000次查询记录一次日志）
+_cache_hits = 0
+_cache_lookups = 0
+
+# 实体标签说明表：启动时预先生成，替代每个实体一次的spacy.explain调用
+_ner_explain: Dict[str, str] = {}
+
+
+def _doc_cache_get(key: bytes):
+    """从缓存取Doc（LRU：命中移到末尾），未命中返回None"""
+    cached = _doc_cache.get(key)
+    if cached is None:
+        return None
+    _doc_cache.move_to_end(key)
+    return Doc(nlp_model.vocab).from_bytes(cached)
+
+
+def _doc_cache_put(key: bytes, doc) -> None:
+    """存入缓存，超出容量时淘汰最久未用的条目"""
+    _doc_cache[key] = doc.to_bytes()
+    while len(_doc_cache) > DOC_CACHE_SIZE:
+        _doc_cache.popitem(last=False)
+
+
+async def _doc_cache_lookup(key: bytes):
+    """查缓存：优先Redis（跨worker共享），失败时降级为进程内LRU"""
+    global _redis_client
+    if _redis_client is not None:
+        try:
+            cached = await _redis_client.get(key)
+            if cached is not None:
+                return Doc(nlp_model.vocab).from_bytes(cached)
+            return None
+        except Exception as e:
+            logger.warning(f"Redis读取失败，退回进程内Doc缓存: {e}")
+            _redis_client = None
+    if DOC_CACHE_SIZE > 0:
+        return _doc_cache_get(key)
+    return None
+
+
+async def _doc_cache_store(key: bytes, doc) -> None:
+    """写缓存：优先Redis，失败时降级为进程内LRU"""
+    global _redis_client
+    if _redis_client is not None:
+        try:
+            await _redis_client.set(key, doc.to_bytes(), ex=REDIS_DOC_TTL)
+            return
+        except Exception as e:
+            logger.warning(f"Redis写入失败，退回进程内Doc缓存: {e}")
+            _redis_client = None
+    if DOC_CACHE_SIZE > 0:
+        _doc_cache_put(key, doc)
+
+
+# Flesch Reading Ease分段阈值与对应难度等级（bisect_right查表）
+_LEVEL_BOUNDS = (30, 50, 60, 70, 80, 90)
+_LEVELS = ("非常困难", "困难", "较困难", "标准", "较容易", "容易", "非常容易")
+
+# 可选依赖：Numba把音节计数内核编译为原生代码（lifespan中预热），
+# 未安装时退回纯Python实现
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+
+def _count_syllables_impl(word: str) -> int:
+    """音节估算内核：元音组计数，处理尾部不发音的e（Numba可编译的字符扫描）"""
+    count = 0
+    prev_vowel = False
+    for i in range(len(word)):
+        is_vowel = word[i] in 'aeiouy'
+        if is_vowel and not prev_vowel:
+            count += 1
+        prev_vowel = is_vowel
+    # 词尾不发音的e（如make、there），但le结尾（table）除外
+    if count > 1 and len(word) >= 2 and word[-1] == 'e' and word[-2] != 'l':
+        count -= 1
+    return count if count > 0 else 1
+
+
+if _njit is not None:
+    _count_syllables_impl = _njit(cache=True)(_count_syllables_impl)
+
+
+@lru_cache(maxsize=8192)
+def _count_syllables(word: str) -> int:
+    """估算单词音节数（记忆化包装，内核见_count_syllables_impl）"""
+    return _count_syllables_impl(word.lower())
+
+
+def _readability(doc) -> Dict[str, float]:
+    """
+    单遍扫描Doc计算全部可读性指标
+
+    词数、句数、音节数、字母数只统计一次，再代入各公式的闭式解，
+    避免textstat对同一文本做六次独立的分词和音节统计。
+    """
+    words = 0
+    letters = 0
+    syllables = 0
+    polysyllables = 0  # 3个音节及以上的词（gunning fog / SMOG用）
+
+    for token in doc:
+        if not token.is_alpha:
+            continue
+        words += 1
+        letters += len(token)
+        syl = _count_syllables(token.text)
+        syllables += syl
+        if syl >= 3:
+            polysyllables += 1
+
+    sentence_count = sum(1 for _ in doc.sents)
+
+    if words == 0 or sentence_count == 0:
+        return {
+            'flesch_reading_ease': 0.0,
+            'flesch_kincaid_grade': 0.0,
+            'automated_readability_index': 0.0,
+            'coleman_liau_index': 0.0,
+            'gunning_fog': 0.0,
+            'smog_index': 0.0,
+        }
+
+    words_per_sentence = words / sentence_count
+    syllables_per_word = syllables / words
+
+    # Coleman-Liau：L/S为每100词的字母数/句数
+    cl_l = letters / words * 100
+    cl_s = sentence_count / words * 100
+
+    return {
+        'flesch_reading_ease': 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word,
+        'flesch_kincaid_grade': 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59,
+        'automated_readability_index': 4.71 * (letters / words) + 0.5 * words_per_sentence - 21.43,
+        'coleman_liau_index': 0.0588 * cl_l - 0.296 * cl_s - 15.8,
+        'gunning_fog': 0.4 * (words_per_sentence + 100 * polysyllables / words),
+        'smog_index': 1.043 * math.sqrt(polysyllables * 30 / sentence_count) + 3.1291,
+    }
+
 # 词典文件目录（相对于项目根目录）
 DICTIONARIES_DIR = Path(__file__).parent.parent / "data" / "dictionaries"
 
+
+# 各功能开关对应的管道组件（en_core_web_sm）
+_PIPES_POS = ("tagger", "attribute_ruler", "lemmatizer")
+
+
+def _required_pipes(include_pos: bool, include_ner: bool) -> tuple:
+    """
+    按请求的功能开关挑选要启用的管道组件
+
+    句子边界由parser产出，词数/句数统计也依赖它，因此始终启用；
+    不需要的神经组件（tagger、ner等）整个跳过。
+    """
+    enabled = ["tok2vec", "parser"]
+    if include_pos:
+        enabled.extend(_PIPES_POS)
+    if include_ner:
+        enabled.append("ner")
+    return tuple(enabled)
+
+
+async def _nlp_batch_worker():
+    """后台批处理worker：攒一批待分析文本，按启用组件分组后nlp.pipe处理"""
+    while True:
+        # 至少等到一个请求，再尽量多收集已排队的请求
+        items = [await nlp_queue.get()]
+        while len(items) < NLP_BATCH_SIZE:
+            try:
+                items.append(nlp_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        # 需要相同组件的请求合并为一次pipe调用。
+        # select_pipes会临时改动管道状态，但本worker是唯一调用方，天然串行
+        groups: Dict[tuple, list] = {}
+        for item in items:
+            groups.setdefault(item[1], []).append(item)
+
+        for enabled, group in groups.items():
+            texts = [text for text, _, _ in group]
+            try:
+                with nlp_model.select_pipes(enable=list(enabled)):
+                    docs = list(nlp_model.pipe(texts, batch_size=len(texts)))
+                for doc, (_, _, future) in zip(docs, group):
+                    if not future.done():
+                        future.set_result(doc)
+            except Exception as e:
+                for _, _, future in group:
+                    if not future.done():
+                        future.set_exception(e)
+
+
+async def process_text(text: str, enabled: Optional[tuple] = None):
+    """返回文本对应的spaCy Doc：先查缓存，未命中再经批处理队列分析"""
+    global _cache_hits, _cache_lookups
+
+    if enabled is None:
+        enabled = _required_pipes(include_pos=True, include_ner=True)
+
+    key = None
+    if DOC_CACHE_SIZE > 0 or _redis_client is not None:
+        # 不同组件组合产出的Doc内容不同，缓存键需区分
+        key = hashlib.blake2b(
+            ','.join(enabled).encode() + b'\x00' + text.encode("utf-8"),
+            digest_size=16
+        ).digest()
+        doc = await _doc_cache_lookup(key)
+
+        _cache_lookups += 1
+        if doc is not None:
+            _cache_hits += 1
+        if _cache_lookups % 1000 == 0:
+            logger.info(f"Doc缓存命中率: {_cache_hits / _cache_lookups:.1%} "
+                        f"({_cache_hits}/{_cache_lookups})")
+
+        if doc is not None:
+            return doc
+
+    future = asyncio.get_running_loop().create_future()
+    await nlp_queue.put((text, enabled, future))
+    doc = await future
+
+    if key is not None:
+        await _doc_cache_store(key, doc)
+    return doc
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """应用生命周期管理"""
-    global nlp_model
+    global nlp_model, nlp_sents, nlp_queue, _redis_client
+    batch_worker = None
     try:
         # 启动时加载spaCy模型
-        logger.info("正在加载spaCy英语模型...")
-        nlp_model = spacy.load("en_core_web_sm")
+        _setup_device()
+        logger.info(f"正在加载spaCy英语模型: {NLP_MODEL_NAME}...")
+        nlp_model = spacy.load(NLP_MODEL_NAME)
         logger.info("spaCy模型加载成功")
+
+        # 只需分句的请求走规则管道（见nlp_sents定义处说明）
+        nlp_sents = spacy.blank("en")
+        nlp_sents.add_pipe("sentencizer")
+
+        # 预生成实体标签说明表
+        if "ner" in nlp_model.pipe_names:
+            _ner_explain.update({
+                label: (spacy.explain(label) or label)
+                for label in nlp_model.get_pipe("ner").labels
+            })
+
+        # 预热音节计数内核（Numba可用时在此支付JIT编译成本，而非首个请求）
+        _count_syllables("warmup")
+
+        # 连接Redis共享Doc缓存（可选，失败则退回进程内LRU）
+        if aioredis is not None and REDIS_URL:
+            try:
+                _redis_client = aioredis.from_url(REDIS_URL)
+                await _redis_client.ping()
+                logger.info("Doc缓存使用Redis共享")
+            except Exception as e:
+                logger.warning(f"Redis不可用，使用进程内Doc缓存: {e}")
+                _redis_client = None
+
+        # 启动NLP批处理worker
+        nlp_queue = asyncio.Queue()
+        batch_worker = asyncio.create_task(_nlp_batch_worker())
         yield
     except OSError as e:
         logger.error(f"无法加载spaCy模型: {e}")
-        logger.error("请运行: python -m spacy download en_core_web_sm")
+        logger.error(f"请运行: python -m spacy download {NLP_MODEL_NAME}")
         raise
     finally:
         # 清理资源
         logger.info("正在清理资源...")
+        if batch_worker is not None:
+            batch_worker.cancel()
+        if _redis_client is not None:
+            try:
+                await _redis_client.aclose()
+            except Exception:
+                pass
 
 # 创建FastAPI应用
 app = FastAPI(
     title="英语阅读NLP服务",
     description="提供文本分析、句子分割、词性标注、命名实体识别等功能",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=_DefaultJSONResponse
 )
 
 # 配置CORS
@@ -62,6 +401,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 压缩响应：长文本的分析结果是高度重复的JSON（词性/标签字符串反复出现），
+# gzip后体积约为原来的1/5~1/10；小响应不压缩
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # 请求模型
 class TextAnalysisRequest(BaseModel):
     text: str
@@ -70,12 +413,16 @@ class TextAnalysisRequest(BaseModel):
     include_ner: bool = True
     include_dependencies: bool = False
     include_difficulty: bool = True
+    # token输出布局：aos为每token一个字典（默认，向后兼容）；
+    # soa为八个并行数组，JSON中不重复键名，体积约省40%
+    token_format: Literal["aos", "soa"] = "aos"
 
 class SentenceInfo(BaseModel):
     text: str
     start: int
     end: int
-    tokens: List[Dict[str, Any]]
+    # aos布局为字典列表，soa布局为列名->并行数组
+    tokens: Union[List[Dict[str, Any]], Dict[str, List[Any]]]
 
 class EntityInfo(BaseModel):
     text: str
@@ -117,7 +464,7 @@ async def health_check():
     return {
         "status": "healthy" if nlp_model is not None else "unhealthy",
         "spacy_model_loaded": nlp_model is not None,
-        "model_name": "en_core_web_sm" if nlp_model else None
+        "model_name": NLP_MODEL_NAME if nlp_model else None
     }
 
 @app.post("/analyze", response_model=TextAnalysisResponse)
@@ -141,8 +488,11 @@ async def analyze_text(request: TextAnalysisRequest):
         raise HTTPException(status_code=400, detail="文本不能为空")
 
     try:
-        # 使用spaCy处理文本
-        doc = nlp_model(request.text)
+        # 使用spaCy处理文本（经批处理队列，合并并发请求；只启用需要的组件）
+        doc = await process_text(
+            request.text,
+            _required_pipes(request.include_pos, request.include_ner)
+        )
 
         # 基础统计
         word_count = len([token for token in doc if not token.is_space and not token.is_punct])
@@ -156,21 +506,46 @@ async def analyze_text(request: TextAnalysisRequest):
 
         # 句子分割和词性标注
         if request.include_sentences or request.include_pos:
+            if request.include_pos:
+                # 一次性把token属性导出为NumPy列，避免逐token的
+                # Python属性访问（每token约8次PyObject往返）
+                arr = doc.to_array([POS, TAG, LEMMA, IS_ALPHA, IS_STOP, IDX, IS_SPACE])
+                strings = doc.vocab.strings
+
             sentences = []
             for sent in doc.sents:
-                tokens = []
+                tokens: Union[list, dict] = []
                 if request.include_pos:
-                    for token in sent:
-                        if not token.is_space:
+                    rows = arr[sent.start:sent.end].tolist()
+                    if request.token_format == "soa":
+                        cols = [
+                            (token.text, strings[lemma_id], _POS_NAMES[pos_id], strings[tag_id],
+                             bool(is_alpha), bool(is_stop), idx, idx + len(token.text))
+                            for token, (pos_id, tag_id, lemma_id, is_alpha, is_stop, idx, is_space)
+                            in zip(sent, rows) if not is_space
+                        ]
+                        texts, lemmas, poss, tags, alphas, stops, starts, ends = (
+                            map(list, zip(*cols)) if cols else ([] for _ in range(8))
+                        )
+                        tokens = {
+                            "text": texts, "lemma": lemmas, "pos": poss, "tag": tags,
+                            "is_alpha": alphas, "is_stop": stops,
+                            "start": starts, "end": ends
+                        }
+                    else:
+                        for token, (pos_id, tag_id, lemma_id, is_alpha, is_stop, idx, is_space) in zip(sent, rows):
+                            if is_space:
+                                continue
+                            text = token.text
                             tokens.append({
-                                "text": token.text,
-                                "lemma": token.lemma_,
-                                "pos": token.pos_,
-                                "tag": token.tag_,
-                                "is_alpha": token.is_alpha,
-                                "is_stop": token.is_stop,
-                                "start": token.idx,
-                                "end": token.idx + len(token.text)
+                                "text": text,
+                                "lemma": strings[lemma_id],
+                                "pos": _POS_NAMES[pos_id],
+                                "tag": strings[tag_id],
+                                "is_alpha": bool(is_alpha),
+                                "is_stop": bool(is_stop),
+                                "start": idx,
+                                "end": idx + len(text)
                             })
 
                 sentences.append(SentenceInfo(
@@ -191,46 +566,22 @@ async def analyze_text(request: TextAnalysisRequest):
                     label=ent.label_,
                     start=ent.start_char,
                     end=ent.end_char,
-                    description=spacy.explain(ent.label_) or ent.label_
+                    description=_ner_explain.get(ent.label_, ent.label_)
                 ))
             response.entities = entities
 
         # 文本难度评估
         if request.include_difficulty:
             try:
-                import textstat
-
-                flesch_ease = textstat.flesch_reading_ease(request.text)
-                flesch_grade = textstat.flesch_kincaid_grade(request.text)
-                ari = textstat.automated_readability_index(request.text)
-                coleman_liau = textstat.coleman_liau_index(request.text)
-                gunning_fog = textstat.gunning_fog(request.text)
-                smog = textstat.smog_index(request.text)
+                metrics = _readability(doc)
+                flesch_ease = metrics['flesch_reading_ease']
 
                 # 根据Flesch Reading Ease确定难度等级
-                if flesch_ease >= 90:
-                    difficulty_level = "非常容易"
-                elif flesch_ease >= 80:
-                    difficulty_level = "容易"
-                elif flesch_ease >= 70:
-                    difficulty_level = "较容易"
-                elif flesch_ease >= 60:
-                    difficulty_level = "标准"
-                elif flesch_ease >= 50:
-                    difficulty_level = "较困难"
-                elif flesch_ease >= 30:
-                    difficulty_level = "困难"
-                else:
-                    difficulty_level = "非常困难"
+                difficulty_level = _LEVELS[bisect.bisect_right(_LEVEL_BOUNDS, flesch_ease)]
 
                 response.difficulty = DifficultyInfo(
-                    flesch_reading_ease=flesch_ease,
-                    flesch_kincaid_grade=flesch_grade,
-                    automated_readability_index=ari,
-                    coleman_liau_index=coleman_liau,
-                    gunning_fog=gunning_fog,
-                    smog_index=smog,
-                    difficulty_level=difficulty_level
+                    difficulty_level=difficulty_level,
+                    **metrics
                 )
             except Exception as e:
                 logger.warning(f"难度评估失败: {e}")
@@ -241,15 +592,96 @@ async def analyze_text(request: TextAnalysisRequest):
         logger.error(f"文本分析失败: {e}")
         raise HTTPException(status_code=500, detail=f"文本分析失败: {str(e)}")
 
+@app.post("/analyze/stream")
+async def analyze_text_stream(request: TextAnalysisRequest):
+    """
+    流式分析英语文本（NDJSON）
+
+    逐句输出token块，实体与汇总信息随后各占一行；
+    响应峰值内存为单句级而非全文级，客户端可边接收边渲染。
+    /analyze保持原有的整体响应格式不变
+    """
+    global nlp_model
+
+    if nlp_model is None:
+        raise HTTPException(status_code=500, detail="NLP模型未加载")
+
+    if not request.text.strip():
+        raise HTTPException(status_code=400, detail="文本不能为空")
+
+    doc = await process_text(
+        request.text,
+        _required_pipes(request.include_pos, request.include_ner)
+    )
+
+    def generate():
+        if request.include_pos:
+            arr = doc.to_array([POS, TAG, LEMMA, IS_ALPHA, IS_STOP, IDX, IS_SPACE])
+            strings = doc.vocab.strings
+
+        sentence_count = 0
+        for sent in doc.sents:
+            sentence_count += 1
+            item = {
+                "type": "sentence",
+                "text": sent.text.strip(),
+                "start": sent.start_char,
+                "end": sent.end_char
+            }
+            if request.include_pos:
+                rows = arr[sent.start:sent.end].tolist()
+                item["tokens"] = [
+                    {
+                        "text": token.text,
+                        "lemma": strings[lemma_id],
+                        "pos": _POS_NAMES[pos_id],
+                        "tag": strings[tag_id],
+                        "is_alpha": bool(is_alpha),
+                        "is_stop": bool(is_stop),
+                        "start": idx,
+                        "end": idx + len(token.text)
+                    }
+                    for token, (pos_id, tag_id, lemma_id, is_alpha, is_stop, idx, is_space)
+                    in zip(sent, rows) if not is_space
+                ]
+            yield _json_dumps(item) + b"\n"
+
+        if request.include_ner:
+            for ent in doc.ents:
+                yield _json_dumps({
+                    "type": "entity",
+                    "text": ent.text,
+                    "label": ent.label_,
+                    "start": ent.start_char,
+                    "end": ent.end_char,
+                    "description": _ner_explain.get(ent.label_, ent.label_)
+                }) + b"\n"
+
+        summary = {
+            "type": "summary",
+            "word_count": len([token for token in doc if not token.is_space and not token.is_punct]),
+            "sentence_count": sentence_count
+        }
+        if request.include_difficulty:
+            metrics = _readability(doc)
+            summary["difficulty"] = {
+                "difficulty_level": _LEVELS[bisect.bisect_right(_LEVEL_BOUNDS, metrics['flesch_reading_ease'])],
+                **metrics
+            }
+        yield _json_dumps(summary) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 @app.post("/sentences")
 async def extract_sentences(text: str):
     """提取句子（简化接口）"""
-    global nlp_model
+    global nlp_sents
 
-    if nlp_model is None:
+    if nlp_sents is None:
         raise HTTPException(status_code=500, detail="NLP模型未加载")
 
-    doc = nlp_model(text)
+    # 规则分句足够快，直接内联执行，不走批处理队列和Doc缓存
+    doc = nlp_sents(text)
     sentences = [sent.text.strip() for sent in doc.sents]
 
     return {
@@ -265,12 +697,12 @@ async def extract_entities(text: str):
     if nlp_model is None:
         raise HTTPException(status_code=500, detail="NLP模型未加载")
 
-    doc = nlp_model(text)
+    doc = await process_text(text, ("tok2vec", "ner"))
     entities = [
         {
             "text": ent.text,
             "label": ent.label_,
-            "description": spacy.explain(ent.label_) or ent.label_
+            "description": _ner_explain.get(ent.label_, ent.label_)
         }
         for ent in doc.ents
     ]
@@ -303,6 +735,44 @@ class WordLookupRequest(BaseModel):
     word: str
     dictionary_ids: Optional[List[int]] = None
 
+# 单词查询缓存：词条在两次导入之间不可变，重复查询直接从内存命中，
+# 省去SQLite B树查找和行重组。导入/删除/更新词典时整体失效
+LOOKUP_CACHE_SIZE = 50000
+LOOKUP_CACHE_TTL = 3600.0  # 秒
+_lookup_cache: "OrderedDict[tuple, tuple]" = OrderedDict()  # key -> (过期时间, entries)
+_lookup_cache_lock = threading.Lock()
+
+
+def _cached_lookup(word: str, dict_ids: Optional[List[int]] = None) -> list:
+    """带LRU+TTL缓存的单词查询"""
+    key = (word.lower(), tuple(sorted(dict_ids)) if dict_ids else None)
+    now = time.monotonic()
+
+    with _lookup_cache_lock:
+        hit = _lookup_cache.get(key)
+        if hit is not None and hit[0] > now:
+            _lookup_cache.move_to_end(key)
+            return hit[1]
+
+    entries = get_importer().lookup_word(word)
+
+    with _lookup_cache_lock:
+        _lookup_cache[key] = (now + LOOKUP_CACHE_TTL, entries)
+        while len(_lookup_cache) > LOOKUP_CACHE_SIZE:
+            _lookup_cache.popitem(last=False)
+    return entries
+
+
+def _invalidate_lookup_cache() -> None:
+    """词典集合变化后清空查询缓存"""
+    with _lookup_cache_lock:
+        _lookup_cache.clear()
+
+# 扫描结果缓存：(目录mtime_ns, 文件列表)。UI轮询时目录通常没变，
+# 可跳过对全部文件的重复stat
+_scan_cache: Optional[tuple] = None
+
+
 @app.get("/dictionary/scan")
 async def scan_dictionaries():
     """
@@ -310,10 +780,19 @@ async def scan_dictionaries():
 
     扫描 data/dictionaries/ 目录下的词典文件
     """
+    global _scan_cache
+
     # 确保目录存在
     DICTIONARIES_DIR.mkdir(parents=True, exist_ok=True)
 
-    files = scan_dictionary_files(str(DICTIONARIES_DIR))
+    mtime = DICTIONARIES_DIR.stat().st_mtime_ns
+    if _scan_cache is not None and _scan_cache[0] == mtime:
+        files = _scan_cache[1]
+    else:
+        # stat大量文件是阻塞IO，放到线程中执行，避免卡住事件循环
+        files = await asyncio.to_thread(scan_dictionary_files, str(DICTIONARIES_DIR))
+        _scan_cache = (mtime, files)
+
     return {
         "directory": str(DICTIONARIES_DIR),
         "files": files,
@@ -342,8 +821,6 @@ async def lookup_word(word: str, dictionary_ids: Optional[str] = None):
     if not word or not word.strip():
         raise HTTPException(status_code=400, detail="单词不能为空")
 
-    importer = get_importer()
-
     # 解析词典ID列表
     dict_ids = None
     if dictionary_ids:
@@ -352,7 +829,7 @@ async def lookup_word(word: str, dictionary_ids: Optional[str] = None):
         except ValueError:
             raise HTTPException(status_code=400, detail="无效的词典ID格式")
 
-    entries = importer.lookup_word(word.strip())
+    entries = _cached_lookup(word.strip(), dict_ids)
 
     return {
         "word": word,
@@ -366,8 +843,7 @@ async def lookup_word_post(request: WordLookupRequest):
     if not request.word or not request.word.strip():
         raise HTTPException(status_code=400, detail="单词不能为空")
 
-    importer = get_importer()
-    entries = importer.lookup_word(request.word.strip())
+    entries = _cached_lookup(request.word.strip(), request.dictionary_ids)
 
     return {
         "word": request.word,
@@ -394,11 +870,12 @@ async def get_dictionary_status(dictionary_id: int):
     return status
 
 @app.post("/dictionary/import")
-async def import_dictionary(request: DictionaryImportRequest, background_tasks: BackgroundTasks):
+async def import_dictionary(request: DictionaryImportRequest):
     """
     导入词典文件
 
-    从 data/dictionaries/ 目录导入指定的词典文件
+    从 data/dictionaries/ 目录导入指定的词典文件，
+    解析在常驻导入线程池中执行，不阻塞NLP请求
     """
     file_path = DICTIONARIES_DIR / request.file_name
 
@@ -420,37 +897,9 @@ async def import_dictionary(request: DictionaryImportRequest, background_tasks:
     if existing:
         raise HTTPException(status_code=400, detail=f"词典 '{request.name}' 已存在")
 
-    # 创建词典记录
-    dictionary_id = importer.db.create_dictionary(
-        name=request.name,
-        source_format=file_info['format'],
-        description=request.description,
-        source_file=str(file_path),
-        file_size=file_info['size'],
-        priority=request.priority,
-        import_status='pending',
-        import_progress=0.0
-    )
-
-    # 在后台执行导入
-    def do_import():
-        try:
-            importer.db.update_import_progress(dictionary_id, 0.0, 'importing')
-            importer.import_dictionary(
-                str(file_path),
-                request.name,
-                request.description,
-                request.priority
-            )
-        except Exception as e:
-            logger.error(f"导入词典失败: {e}")
-            importer.db.update_import_progress(dictionary_id, 0.0, 'failed', error=str(e))
-
-    # 由于词典记录已创建，需要删除后重新导入
-    importer.db.delete_dictionary(dictionary_id)
-
-    background_tasks.add_task(
-        importer.import_dictionary,
+    # 提交到常驻导入线程池，进度经 /dictionary/{id}/status 查询
+    _invalidate_lookup_cache()
+    importer.import_dictionary_background(
         str(file_path),
         request.name,
         request.description,
@@ -488,6 +937,7 @@ async def update_dictionary(dictionary_id: int, request: DictionaryUpdateRequest
 
     if updates:
         importer.update_dictionary(dictionary_id, **updates)
+        _invalidate_lookup_cache()
 
     return {"message": "更新成功", "dictionary_id": dictionary_id}
 
@@ -502,8 +952,20 @@ async def delete_dictionary(dictionary_id: int):
         raise HTTPException(status_code=404, detail="词典不存在")
 
     importer.delete_dictionary(dictionary_id)
+    _invalidate_lookup_cache()
     return {"message": "删除成功", "dictionary_id": dictionary_id}
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # loop/http给auto：装了uvicorn[standard]的平台自动选
+    # uvloop+httptools，Windows等没有uvloop的环境退回asyncio实现
+    # 而不是启动报错。多worker可跨核扩展，但每个worker进程各自
+    # 加载spaCy模型（约200MB/个），默认单worker
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        workers=int(os.getenv("NLP_WORKERS", "1"))
+    )
\ No newline at end of file
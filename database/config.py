@@ -13,6 +13,24 @@ DATABASE_CONFIG = {
         'path': Path(__file__).parent / 'english_reading.db',
         'timeout': 30.0,  # 连接超时时间（秒）
         'check_same_thread': False,  # 允许多线程访问
+        # 连接级PRAGMA：WAL让读写并发不互相阻塞（导入词典时仍可查询），
+        # mmap直接从页缓存读页，减少read()系统调用
+        'pragmas': {
+            # 增量回收：DELETE后可用incremental_vacuum归还空页，避免缓存
+            # 清理后文件稀疏化。必须在库文件初始化前设置（故放在首位，
+            # 早于journal_mode）；已有旧库需VACUUM一次才生效
+            'auto_vacuum': 'INCREMENTAL',
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'mmap_size': 268435456,  # 256MB
+            'cache_size': -64000,  # 64MB（负值单位为KB）
+            'temp_store': 'MEMORY',
+            # 写锁竞争时等待而不是立刻SQLITE_BUSY报错（毫秒）
+            'busy_timeout': 5000,
+            # SQLite默认不执行外键约束；开启后schema里的ON DELETE CASCADE
+            # 才生效（每连接设置，不持久化）
+            'foreign_keys': 'ON',
+        },
     },
 
     # PostgreSQL配置（生产环境）
@@ -4,16 +4,163 @@
 提供数据库连接和基础CRUD操作
 """
 
-import sqlite3
+# 可选依赖：pysqlite3-binary自带较新的SQLite（RETURNING、UPSERT优化、
+# 更快的FTS5），没有时退回stdlib sqlite3（Python 3.11自带3.35+，功能兼容）
+try:
+    import pysqlite3 as sqlite3
+except ImportError:
+    import sqlite3
+
+import hashlib
 import json
+import threading
+import time
+from collections import Counter, OrderedDict
+from operator import itemgetter
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Iterable
 from contextlib import contextmanager
 
+from config import DATABASE_CONFIG, CACHE_CONFIG
+
+# 可选依赖：orjson编解码JSON列比stdlib json快约一个数量级
+try:
+    import orjson
+
+    def _json_encode(value) -> bytes:
+        return orjson.dumps(value)
+
+    _json_decode = orjson.loads
+except ImportError:
+    orjson = None
+
+    def _json_encode(value) -> bytes:
+        return json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+    def _json_decode(data: bytes):
+        return json.loads(data)
+
+# tags/preferences等声明为JSON类型的列由sqlite3自动编解码
+# （连接需开启detect_types=PARSE_DECLTYPES，见_connect）
+sqlite3.register_adapter(list, _json_encode)
+sqlite3.register_adapter(dict, _json_encode)
+sqlite3.register_converter('JSON', _json_decode)
+# TIMESTAMP/DATE列保持字符串语义，避免PARSE_DECLTYPES触发默认的datetime转换
+sqlite3.register_converter('TIMESTAMP', lambda b: b.decode('utf-8'))
+sqlite3.register_converter('DATE', lambda b: b.decode('utf-8'))
+
+# SQLite连接级PRAGMA（WAL、mmap等），见config.py中的说明
+_SQLITE_PRAGMAS = DATABASE_CONFIG['sqlite'].get('pragmas', {})
+
+
+def _source_hash(text: str) -> int:
+    """源文本的64位稳定哈希，映射到SQLite带符号INTEGER
+
+    翻译缓存以长句为键时，TEXT等值比较要逐字节走完整个键；先按
+    8字节整数哈希缩小到单行再复核原文，B树比较开销与文本长度无关。
+    """
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+# 复合索引：为热点SELECT的WHERE+ORDER BY提供免排序路径。
+# 与schema.sql保持一致，连接时为已有的旧库按需补建
+_EXTRA_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_articles_diff_created "
+    "ON articles(difficulty_level, created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_vocabulary_user_first "
+    "ON vocabulary(user_id, first_encountered DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_reading_history_user_started "
+    "ON reading_history(user_id, started_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_vocab_review "
+    "ON vocabulary(user_id, next_review, mastery_level)",
+    "CREATE INDEX IF NOT EXISTS idx_vocab_user_reviewcount "
+    "ON vocabulary(user_id, review_count, first_encountered DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_trans_lastused "
+    "ON translation_cache(last_used)",
+    "CREATE INDEX IF NOT EXISTS idx_trcache_lookup "
+    "ON translation_cache(source_hash, target_language, context_hash)",
+)
+
+# 文章全文搜索的FTS5表和同步触发器（与schema.sql一致，旧库按需补建）
+_FTS_SETUP = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5("
+    "title, content, content='articles', content_rowid='id', "
+    "tokenize='porter unicode61')",
+    "CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN "
+    "INSERT INTO articles_fts(rowid, title, content) "
+    "VALUES (new.id, new.title, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN "
+    "INSERT INTO articles_fts(articles_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content); END",
+    "CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE ON articles BEGIN "
+    "INSERT INTO articles_fts(articles_fts, rowid, title, content) "
+    "VALUES ('delete', old.id, old.title, old.content); "
+    "INSERT INTO articles_fts(rowid, title, content) "
+    "VALUES (new.id, new.title, new.content); END",
+)
+
+# 热点查询提升为模块常量：语句文本稳定，配合连接的语句缓存免去重复prepare
+_Q_GET_USER_BY_ID = "SELECT * FROM users WHERE id = ?"
+_Q_GET_USER_BY_EMAIL = "SELECT * FROM users WHERE email = ?"
+_Q_VERIFY_USER = "SELECT id, password_hash FROM users WHERE email = ?"
+_Q_GET_ARTICLE_BY_ID = "SELECT * FROM articles WHERE id = ?"
+_Q_BUMP_TRANSLATION_USAGE = (
+    "UPDATE translation_cache "
+    "SET usage_count = usage_count + ?, last_used = CURRENT_TIMESTAMP "
+    "WHERE id = ?"
+)
+_Q_UPDATE_VOCAB_REVIEW = '''
+    UPDATE vocabulary
+    SET next_review = ?,
+        ease_factor = ?,
+        interval_days = ?,
+        mastery_level = ?,
+        consecutive_correct = ?,
+        last_reviewed = CURRENT_TIMESTAMP,
+        review_count = review_count + 1,
+        correct_count = correct_count + ?
+    WHERE id = ?
+'''
+_Q_UPSERT_READING_PROGRESS = '''
+    INSERT INTO reading_history
+    (user_id, article_id, reading_progress, reading_time, words_looked_up, last_position)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(user_id, article_id) DO UPDATE SET
+        reading_progress = excluded.reading_progress,
+        reading_time = excluded.reading_time,
+        words_looked_up = excluded.words_looked_up,
+        last_position = excluded.last_position
+'''
+
+# 统计用白名单表名（表名拼进SQL，不可来自外部输入）
+_STATS_TABLES = ('users', 'articles', 'vocabulary', 'translation_cache',
+                 'reading_history', 'learning_stats', 'learning_sessions')
+_Q_DATABASE_STATS = " UNION ALL ".join(
+    f"SELECT '{table}', COUNT(*) FROM {table}" for table in _STATS_TABLES
+)
+
 class DatabaseManager:
     """数据库管理器"""
 
+    # 翻译缓存使用计数的写缓冲阈值（条数/秒），见_record_translation_usage
+    USAGE_FLUSH_SIZE = 64
+    USAGE_FLUSH_INTERVAL = 5.0
+
+    # 阅读进度写缓冲的落库周期（秒），见update_reading_progress
+    PROGRESS_FLUSH_INTERVAL = 2.0
+
+    # 进程内读缓存容量：热点行免去SQLite解析/查计划/B树遍历
+    READ_CACHE_SIZE = 1024
+    TX_CACHE_SIZE = 4096
+
+    # 动态INSERT的可选字段白名单（字段名拼进SQL，不可来自外部输入）
+    ARTICLE_OPTIONAL_FIELDS = ('source_url', 'author', 'published_date', 'difficulty_level',
+                               'word_count', 'sentence_count', 'flesch_score', 'category',
+                               'language', 'tags')
+    VOCAB_OPTIONAL_FIELDS = ('definition', 'pronunciation', 'example_sentence', 'translation',
+                             'difficulty_level', 'source_article_id', 'context', 'word_type')
+
     def __init__(self, db_path: Optional[str] = None):
         """
         初始化数据库管理器
@@ -27,20 +174,190 @@ class DatabaseManager:
 
         self.db_path = str(db_path)
 
+        # 每线程缓存一个长连接：反复的小查询不再支付建连和页缓存冷启动成本
+        self._local = threading.local()
+
+        # 补充索引只需确保一次（跨线程共享标记）
+        self._indexes_ensured = False
+
+        # 翻译缓存使用计数缓冲：命中只在内存累加增量，按阈值合并落库
+        self._usage_counts: Counter = Counter()
+        self._usage_lock = threading.Lock()
+        self._usage_last_flush = time.monotonic()
+
+        # 阅读进度写缓冲：同一(user_id, article_id)的高频更新合并为周期落库
+        self._pending_progress: Dict[tuple, tuple] = {}
+        self._progress_lock = threading.Lock()
+        self._progress_thread: Optional[threading.Thread] = None
+        self._progress_stop = threading.Event()
+
+        # 进程内LRU读缓存（写入方法负责失效对应的键）
+        self._user_cache: OrderedDict = OrderedDict()
+        self._article_cache: OrderedDict = OrderedDict()
+        self._tx_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # 动态INSERT语句缓存：同一字段组合只拼一次SQL文本
+        self._insert_sql_cache: Dict[tuple, tuple] = {}
+
+    def _cache_get(self, cache: OrderedDict, key) -> Optional[Dict]:
+        """从LRU读缓存取值（命中移到末尾），返回浅拷贝避免调用方改动缓存"""
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is None:
+                return None
+            cache.move_to_end(key)
+            return dict(value)
+
+    def _cache_put(self, cache: OrderedDict, key, value: Dict, max_size: int) -> None:
+        """写入LRU读缓存，超容量时淘汰最久未用的条目"""
+        with self._cache_lock:
+            cache[key] = value
+            while len(cache) > max_size:
+                cache.popitem(last=False)
+
+    def _cache_evict(self, cache: OrderedDict, key) -> None:
+        """使单个缓存键失效"""
+        with self._cache_lock:
+            cache.pop(key, None)
+
+    def _connect(self) -> sqlite3.Connection:
+        """打开新连接并应用行工厂和PRAGMA"""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=DATABASE_CONFIG['sqlite'].get('timeout', 30.0),
+            detect_types=sqlite3.PARSE_DECLTYPES,  # JSON列自动编解码
+            check_same_thread=False,
+            cached_statements=512
+        )
+        conn.row_factory = sqlite3.Row  # 使结果可以通过列名访问
+        for pragma, value in _SQLITE_PRAGMAS.items():
+            conn.execute(f"PRAGMA {pragma}={value}")
+        if not self._indexes_ensured:
+            self._ensure_indexes(conn)
+        return conn
+
+    def _ensure_indexes(self, conn: sqlite3.Connection) -> None:
+        """为旧库补建schema.sql中新增的复合索引"""
+        try:
+            # 旧库迁移：补source_hash列；绕过db_manager直插的行（如示例
+            # 数据）哈希为NULL，一并回填（见_source_hash）
+            columns = {row[1] for row in conn.execute(
+                "PRAGMA table_info(translation_cache)")}
+            if columns and 'source_hash' not in columns:
+                conn.execute(
+                    "ALTER TABLE translation_cache ADD COLUMN source_hash INTEGER")
+            if columns:
+                rows = conn.execute(
+                    "SELECT id, source_text FROM translation_cache "
+                    "WHERE source_hash IS NULL").fetchall()
+                if rows:
+                    conn.executemany(
+                        "UPDATE translation_cache SET source_hash = ? WHERE id = ?",
+                        [(_source_hash(text), row_id) for row_id, text in rows])
+
+            for statement in _EXTRA_INDEXES:
+                conn.execute(statement)
+
+            # FTS表首次创建后需rebuild一次，纳入已有文章
+            fts_exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='articles_fts'"
+            ).fetchone()
+            if fts_exists is None:
+                for statement in _FTS_SETUP:
+                    conn.execute(statement)
+                conn.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
+
+            conn.commit()
+        except sqlite3.OperationalError:
+            # 库尚未初始化（表不存在）时跳过，待schema建立后再建
+            conn.rollback()
+        else:
+            self._indexes_ensured = True
+
     @contextmanager
     def get_connection(self):
-        """获取数据库连接的上下文管理器"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # 使结果可以通过列名访问
+        """
+        获取数据库连接的上下文管理器（每线程一条、复用，退出时不关闭）
+
+        每个工作线程持有独立的pragma调优连接，WAL下多线程读互不阻塞；
+        同一线程内嵌套调用复用同一连接，保证transaction()块内的
+        execute_*落在同一事务上。写锁竞争由busy_timeout兜底等待。
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
         try:
             yield conn
-        finally:
+        except Exception:
+            # 出错时回滚，避免未完成的事务泄漏到下一次使用
+            conn.rollback()
+            raise
+
+    def close(self) -> None:
+        """关闭当前线程缓存的连接（先落库待写的缓冲数据）"""
+        self._progress_stop.set()
+        self.flush_reading_progress()
+        self.flush_translation_usage()
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
             conn.close()
+            self._local.conn = None
+
+    @contextmanager
+    def transaction(self):
+        """
+        显式事务上下文管理器
 
-    def execute_query(self, query: str, params: tuple = ()) -> List[Dict]:
+        将多条语句合并为一次提交（一次fsync）；块内调用
+        execute_update/execute_insert时传auto_commit=False跳过逐条提交。
+        异常时整体回滚。
+        """
+        with self.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except Exception:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+
+    @contextmanager
+    def bulk(self):
+        """
+        批量写入上下文：暂停块内所有auto_commit，出块统一提交一次
+
+        与transaction()不同，块内无需改调用方式——create_user/
+        add_vocabulary等高层方法照常调用，其内部的逐条commit被
+        挂起，整个块只fsync一次。适合数据导入和测试造数场景，
+        N次提交合并为1次。异常时整体回滚。
+        """
+        with self.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._local.in_bulk = True
+            try:
+                yield conn
+            except Exception:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+            finally:
+                self._local.in_bulk = False
+
+    def _should_commit(self, auto_commit: bool) -> bool:
+        """bulk()块内挂起逐条提交，由块出口统一提交"""
+        return auto_commit and not getattr(self._local, 'in_bulk', False)
+
+    def execute_query(self, query: str, params: tuple = ()) -> List[sqlite3.Row]:
         """
         执行查询并返回结果
 
+        直接返回sqlite3.Row列表（支持按列名/下标访问），省去逐行构造dict
+        的开销；需要可变dict或JSON序列化时用execute_query_as_dict
+
         Args:
             query: SQL查询语句
             params: 查询参数
@@ -51,16 +368,66 @@ class DatabaseManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            return cursor.fetchall()
+
+    def execute_query_as_dict(self, query: str, params: tuple = ()) -> List[Dict]:
+        """
+        执行查询并把每行物化为dict（用于需要修改行或序列化为JSON的调用方）
+
+        Args:
+            query: SQL查询语句
+            params: 查询参数
+
+        Returns:
+            查询结果列表（dict）
+        """
+        return [dict(row) for row in self.execute_query(query, params)]
+
+    def execute_query_iter(self, query: str, params: tuple = ()) -> Iterable[sqlite3.Row]:
+        """
+        执行查询并逐行产出结果（不fetchall整列表物化）
+
+        适合大结果集的流式处理/分页导出；迭代完成前请勿在同一线程
+        发起写操作。
+
+        Args:
+            query: SQL查询语句
+            params: 查询参数
+
+        Yields:
+            sqlite3.Row
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            yield from cursor
 
-    def execute_update(self, query: str, params: tuple = ()) -> int:
+    def fetch_scalar(self, query: str, params: tuple = ()) -> Any:
+        """
+        执行查询并返回首行首列的标量值（无结果时返回None）
+
+        Args:
+            query: SQL查询语句
+            params: 查询参数
+
+        Returns:
+            标量值或None
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None  # 标量无需构造Row对象
+            cursor.execute(query, params)
+            row = cursor.fetchone()
+            return row[0] if row else None
+
+    def execute_update(self, query: str, params: tuple = (), auto_commit: bool = True) -> int:
         """
         执行更新操作
 
         Args:
             query: SQL更新语句
             params: 更新参数
+            auto_commit: 是否立即提交（在transaction()块内传False）
 
         Returns:
             受影响的行数
@@ -68,16 +435,18 @@ class DatabaseManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
-            conn.commit()
+            if self._should_commit(auto_commit):
+                conn.commit()
             return cursor.rowcount
 
-    def execute_insert(self, query: str, params: tuple = ()) -> int:
+    def execute_insert(self, query: str, params: tuple = (), auto_commit: bool = True) -> int:
         """
         执行插入操作
 
         Args:
             query: SQL插入语句
             params: 插入参数
+            auto_commit: 是否立即提交（在transaction()块内传False）
 
         Returns:
             新插入记录的ID
@@ -85,80 +454,193 @@ class DatabaseManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
-            conn.commit()
+            if self._should_commit(auto_commit):
+                conn.commit()
             return cursor.lastrowid
 
+    def execute_upsert(self, query: str, params: tuple = (), auto_commit: bool = True) -> int:
+        """
+        执行带RETURNING id的UPSERT并返回实际命中行的id
+
+        ON CONFLICT ... DO UPDATE走更新分支时cursor.lastrowid不会
+        刷新，拿到的是连接上一次插入的rowid（可能属于别的表）；
+        必须用RETURNING子句取回真正插入/更新那一行的id。
+        DO NOTHING分支不产出行，此时返回0，由调用方回查。
+
+        Args:
+            query: 以RETURNING id结尾的UPSERT语句
+            params: 绑定参数
+            auto_commit: 是否立即提交（在transaction()块内传False）
+
+        Returns:
+            命中行的id；冲突且DO NOTHING时返回0
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(query, params)
+            row = cursor.fetchone()
+            if self._should_commit(auto_commit):
+                conn.commit()
+            return row[0] if row else 0
+
+    def execute_many(self, query: str, seq_of_params: Iterable[tuple]) -> int:
+        """
+        批量执行同一语句（单事务一次提交）
+
+        Args:
+            query: SQL语句
+            seq_of_params: 参数元组序列
+
+        Returns:
+            受影响的行数
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(query, seq_of_params)
+            if self._should_commit(True):
+                conn.commit()
+            return cursor.rowcount
+
     # 用户相关操作
     def create_user(self, username: str, email: str, password_hash: str,
                    preferences: Optional[Dict] = None, reading_level: str = 'intermediate') -> int:
-        """创建新用户"""
-        preferences_json = json.dumps(preferences) if preferences else None
-
+        """创建新用户（preferences由JSON列适配器自动序列化）"""
         query = '''
             INSERT INTO users (username, email, password_hash, preferences, reading_level)
             VALUES (?, ?, ?, ?, ?)
         '''
-        return self.execute_insert(query, (username, email, password_hash, preferences_json, reading_level))
+        return self.execute_insert(query, (username, email, password_hash, preferences, reading_level))
 
     def get_user_by_email(self, email: str) -> Optional[Dict]:
         """根据邮箱获取用户"""
-        query = "SELECT * FROM users WHERE email = ?"
-        results = self.execute_query(query, (email,))
+        results = self.execute_query(_Q_GET_USER_BY_EMAIL, (email,))
         return results[0] if results else None
 
     def get_user_by_id(self, user_id: int) -> Optional[Dict]:
-        """根据ID获取用户"""
-        query = "SELECT * FROM users WHERE id = ?"
-        results = self.execute_query(query, (user_id,))
-        return results[0] if results else None
+        """根据ID获取用户（热点行走进程内LRU缓存）"""
+        cached = self._cache_get(self._user_cache, user_id)
+        if cached is not None:
+            return cached
+
+        results = self.execute_query(_Q_GET_USER_BY_ID, (user_id,))
+        if results:
+            self._cache_put(self._user_cache, user_id, results[0], self.READ_CACHE_SIZE)
+            return results[0]
+        return None
+
+    def verify_user(self, email: str) -> Optional[tuple]:
+        """
+        登录专用的轻量查询：只取(id, password_hash)
+
+        登录是最常见的首次访问，后面紧跟CPU密集的哈希校验；这里走
+        无row_factory的元组路径，不构造Row/dict，也只读两列。
+
+        Returns:
+            (user_id, password_hash)元组，用户不存在时返回None
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(_Q_VERIFY_USER, (email,))
+            return cursor.fetchone()
 
     def update_user_login(self, user_id: int) -> None:
         """更新用户最后登录时间"""
         query = "UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ?"
         self.execute_update(query, (user_id,))
+        self._cache_evict(self._user_cache, user_id)
+
+    def _prepared_insert(self, verb: str, table: str, base_fields: tuple,
+                         optional_fields: tuple, kwargs: Dict,
+                         conflict: tuple = ()) -> tuple:
+        """
+        按"表 + 实际提供的可选字段组合"缓存动态INSERT语句
+
+        同一字段组合只拼一次SQL文本；语句文本稳定后才能命中sqlite3
+        连接内部的语句缓存，避免热点插入路径反复prepare。同时缓存
+        按字段顺序取值的itemgetter，重复插入时在C层提取绑定值，
+        不再走Python层的逐字段循环。
+
+        传入conflict（冲突键列）时生成UPSERT：提供的可选字段原地更新为
+        excluded值，未提供的列保持不变（不像OR REPLACE那样整行重建）。
+
+        Returns:
+            (sql, getter)，getter(kwargs)按字段顺序返回可选字段值元组
+        """
+        present = tuple(f for f in optional_fields if f in kwargs)
+        key = (table, present)
+        cached = self._insert_sql_cache.get(key)
+        if cached is None:
+            fields = base_fields + present
+            sql = (f"{verb} INTO {table} ({', '.join(fields)}) "
+                   f"VALUES ({', '.join('?' * len(fields))})")
+            if conflict:
+                if present:
+                    updates = ', '.join(f"{f} = excluded.{f}" for f in present)
+                    sql += f" ON CONFLICT({', '.join(conflict)}) DO UPDATE SET {updates}"
+                else:
+                    sql += f" ON CONFLICT({', '.join(conflict)}) DO NOTHING"
+            if not present:
+                getter = lambda kw: ()
+            elif len(present) == 1:
+                field = present[0]
+                getter = lambda kw: (kw[field],)
+            else:
+                getter = itemgetter(*present)
+            cached = (sql, getter)
+            self._insert_sql_cache[key] = cached
+        return cached
 
     # 文章相关操作
     def create_article(self, title: str, content: str, **kwargs) -> int:
-        """创建新文章"""
-        # 基础字段
-        fields = ['title', 'content']
-        values = [title, content]
-        placeholders = ['?', '?']
+        """创建新文章（tags列表由JSON列适配器自动序列化）"""
+        query, getter = self._prepared_insert(
+            'INSERT', 'articles', ('title', 'content'),
+            self.ARTICLE_OPTIONAL_FIELDS, kwargs)
+        return self.execute_insert(query, (title, content) + getter(kwargs))
 
-        # 可选字段
-        optional_fields = ['source_url', 'author', 'published_date', 'difficulty_level',
-                          'word_count', 'sentence_count', 'flesch_score', 'category', 'language']
+    def bulk_create_articles(self, rows: Iterable[Dict]) -> int:
+        """
+        批量创建文章（单事务，适合批量导入和测试造数）
 
-        for field in optional_fields:
-            if field in kwargs:
-                fields.append(field)
-                values.append(kwargs[field])
-                placeholders.append('?')
+        所有行必须带相同的字段组合：语句只prepare一次，N行一次
+        executemany提交，而逐条create_article要走N次插入+N次提交。
 
-        # 处理tags（转换为JSON）
-        if 'tags' in kwargs:
-            fields.append('tags')
-            values.append(json.dumps(kwargs['tags']) if isinstance(kwargs['tags'], list) else kwargs['tags'])
-            placeholders.append('?')
+        Args:
+            rows: 文章字段字典序列（title/content必填，
+                  可选字段见ARTICLE_OPTIONAL_FIELDS）
 
-        query = f'''
-            INSERT INTO articles ({', '.join(fields)})
-            VALUES ({', '.join(placeholders)})
-        '''
-        return self.execute_insert(query, tuple(values))
+        Returns:
+            插入的行数
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+        kwargs = {k: v for k, v in rows[0].items() if k not in ('title', 'content')}
+        query, getter = self._prepared_insert(
+            'INSERT', 'articles', ('title', 'content'),
+            self.ARTICLE_OPTIONAL_FIELDS, kwargs)
+        return self.execute_many(
+            query,
+            ((row['title'], row['content']) + getter(row) for row in rows))
 
     def get_article_by_id(self, article_id: int) -> Optional[Dict]:
-        """根据ID获取文章"""
-        query = "SELECT * FROM articles WHERE id = ?"
-        results = self.execute_query(query, (article_id,))
+        """根据ID获取文章（热点行走进程内LRU缓存）"""
+        cached = self._cache_get(self._article_cache, article_id)
+        if cached is not None:
+            return cached
+
+        results = self.execute_query(_Q_GET_ARTICLE_BY_ID, (article_id,))
         if results:
-            article = results[0]
-            # 解析tags JSON
-            if article['tags']:
+            article = dict(results[0])
+            # tags由JSON列转换器解码；旧库中列声明为TEXT时兜底解析
+            if isinstance(article['tags'], str):
                 try:
                     article['tags'] = json.loads(article['tags'])
                 except json.JSONDecodeError:
                     article['tags'] = []
+            self._cache_put(self._article_cache, article_id, article, self.READ_CACHE_SIZE)
             return article
         return None
 
@@ -172,41 +654,107 @@ class DatabaseManager:
         '''
         return self.execute_query(query, (difficulty_level, limit))
 
-    def search_articles(self, keyword: str, limit: int = 10) -> List[Dict]:
-        """搜索文章"""
-        query = '''
-            SELECT * FROM articles
-            WHERE title LIKE ? OR content LIKE ?
-            ORDER BY created_at DESC
-            LIMIT ?
-        '''
-        keyword_pattern = f'%{keyword}%'
-        return self.execute_query(query, (keyword_pattern, keyword_pattern, limit))
+    def search_articles(self, keyword: str, limit: int = 10,
+                        difficulty_level: Optional[str] = None) -> List[Dict]:
+        """搜索文章（FTS5倒排索引+BM25相关度排序，不可用时退回LIKE扫描）
+
+        difficulty_level: 可选难度过滤。MATCH和普通谓词混在同一个
+        WHERE里会让查询计划器放弃FTS索引退化成全扫，因此先用CTE把
+        FTS命中集物化（超采10倍保证过滤后够数），再JOIN过滤。
+        """
+        if difficulty_level is not None:
+            query = '''
+                WITH fts_matches AS (
+                    SELECT rowid, bm25(articles_fts) AS score
+                    FROM articles_fts
+                    WHERE articles_fts MATCH ?
+                    ORDER BY score
+                    LIMIT ? * 10
+                )
+                SELECT a.* FROM fts_matches f
+                JOIN articles a ON a.id = f.rowid
+                WHERE a.difficulty_level = ?
+                ORDER BY f.score
+                LIMIT ?
+            '''
+        else:
+            query = '''
+                SELECT a.* FROM articles_fts f
+                JOIN articles a ON a.id = f.rowid
+                WHERE articles_fts MATCH ?
+                ORDER BY bm25(articles_fts)
+                LIMIT ?
+            '''
+        # 整体作为短语匹配，转义内部引号避免FTS查询语法错误
+        phrase = '"' + keyword.replace('"', '""') + '"'
+        if difficulty_level is not None:
+            params = (phrase, limit, difficulty_level, limit)
+        else:
+            params = (phrase, limit)
+        try:
+            return self.execute_query(query, params)
+        except sqlite3.OperationalError:
+            # FTS表不可用或查询不合法（如空关键词）时退回LIKE
+            fallback = '''
+                SELECT * FROM articles
+                WHERE (title LIKE ? OR content LIKE ?){}
+                ORDER BY created_at DESC
+                LIMIT ?
+            '''.format(' AND difficulty_level = ?' if difficulty_level is not None else '')
+            keyword_pattern = f'%{keyword}%'
+            fb_params = (keyword_pattern, keyword_pattern)
+            if difficulty_level is not None:
+                fb_params += (difficulty_level,)
+            return self.execute_query(fallback, fb_params + (limit,))
 
     # 生词本相关操作
     def add_vocabulary(self, user_id: int, word: str, **kwargs) -> int:
-        """添加生词"""
-        fields = ['user_id', 'word']
-        values = [user_id, word]
-        placeholders = ['?', '?']
-
-        optional_fields = ['definition', 'pronunciation', 'example_sentence', 'translation',
-                          'difficulty_level', 'source_article_id', 'context', 'word_type']
+        """添加生词（UPSERT：重复添加时原地更新，保留first_encountered等列）"""
+        query, getter = self._prepared_insert(
+            'INSERT', 'vocabulary', ('user_id', 'word'),
+            self.VOCAB_OPTIONAL_FIELDS, kwargs, conflict=('user_id', 'word'))
+        row_id = self.execute_upsert(query + ' RETURNING id',
+                                     (user_id, word) + getter(kwargs))
+        if not row_id:
+            # 无可选字段时UPSERT退化为DO NOTHING，冲突不返回行，回查已有id
+            rows = self.execute_query(
+                'SELECT id FROM vocabulary WHERE user_id = ? AND word = ?',
+                (user_id, word))
+            row_id = rows[0]['id'] if rows else 0
+        return row_id
+
+    def bulk_add_vocabulary(self, rows: Iterable[tuple]) -> int:
+        """
+        批量添加生词（单事务）
 
-        for field in optional_fields:
-            if field in kwargs:
-                fields.append(field)
-                values.append(kwargs[field])
-                placeholders.append('?')
+        Args:
+            rows: (user_id, word, definition, translation) 元组序列
 
-        query = f'''
-            INSERT OR REPLACE INTO vocabulary ({', '.join(fields)})
-            VALUES ({', '.join(placeholders)})
+        Returns:
+            插入的行数
+        """
+        query = '''
+            INSERT OR REPLACE INTO vocabulary (user_id, word, definition, translation)
+            VALUES (?, ?, ?, ?)
         '''
-        return self.execute_insert(query, tuple(values))
+        return self.execute_many(query, rows)
+
+    def get_user_vocabulary(self, user_id: int, limit: int = 50,
+                            before: Optional[str] = None) -> List[Dict]:
+        """获取用户生词本
 
-    def get_user_vocabulary(self, user_id: int, limit: int = 50) -> List[Dict]:
-        """获取用户生词本"""
+        before: 上一页最后一条的first_encountered，传入后走键集分页——
+        复合索引(user_id, first_encountered DESC)上的范围扫描，
+        翻到第N页也是O(LIMIT)，不像OFFSET那样要跳过前面所有行。
+        """
+        if before is not None:
+            query = '''
+                SELECT * FROM vocabulary
+                WHERE user_id = ? AND first_encountered < ?
+                ORDER BY first_encountered DESC
+                LIMIT ?
+            '''
+            return self.execute_query(query, (user_id, before, limit))
         query = '''
             SELECT * FROM vocabulary
             WHERE user_id = ?
@@ -216,7 +764,7 @@ class DatabaseManager:
         return self.execute_query(query, (user_id, limit))
 
     def update_vocabulary_mastery(self, vocab_id: int, mastery_level: int, correct: bool = True) -> None:
-        """更新词汇掌握程度"""
+        """更新词汇掌握程度（批量更新时建议包在transaction()块内合并提交）"""
         query = '''
             UPDATE vocabulary
             SET mastery_level = ?, last_reviewed = CURRENT_TIMESTAMP,
@@ -229,61 +777,198 @@ class DatabaseManager:
     # 翻译缓存相关操作
     def get_translation(self, source_text: str, target_language: str = 'zh',
                        context_hash: Optional[str] = None) -> Optional[Dict]:
-        """获取翻译缓存"""
+        """获取翻译缓存（命中进程内LRU时不再查SQLite，但仍计入使用统计）"""
+        cache_key = (source_text, target_language, context_hash)
+        cached = self._cache_get(self._tx_cache, cache_key)
+        if cached is not None:
+            self._record_translation_usage(cached['id'])
+            return cached
+
+        # 先按8字节整数哈希走idx_trcache_lookup定位，再复核原文防碰撞
+        src_hash = _source_hash(source_text)
         if context_hash:
             query = '''
                 SELECT * FROM translation_cache
-                WHERE source_text = ? AND target_language = ? AND context_hash = ?
+                WHERE source_hash = ? AND source_text = ?
+                  AND target_language = ? AND context_hash = ?
             '''
-            params = (source_text, target_language, context_hash)
+            params = (src_hash, source_text, target_language, context_hash)
         else:
             query = '''
                 SELECT * FROM translation_cache
-                WHERE source_text = ? AND target_language = ? AND context_hash IS NULL
+                WHERE source_hash = ? AND source_text = ?
+                  AND target_language = ? AND context_hash IS NULL
             '''
-            params = (source_text, target_language)
+            params = (src_hash, source_text, target_language)
 
         results = self.execute_query(query, params)
         if results:
-            # 更新使用统计
+            # 使用统计只记入缓冲，读路径不做写提交
             translation = results[0]
-            self.execute_update('''
-                UPDATE translation_cache
-                SET usage_count = usage_count + 1, last_used = CURRENT_TIMESTAMP
-                WHERE id = ?
-            ''', (translation['id'],))
+            self._cache_put(self._tx_cache, cache_key, translation, self.TX_CACHE_SIZE)
+            self._record_translation_usage(translation['id'])
             return translation
         return None
 
+    def _record_translation_usage(self, translation_id: int) -> None:
+        """
+        记录一次翻译缓存命中
+
+        增量先在内存中按id累加（热词的N次命中只占一个槽位），涉及的
+        id数达到USAGE_FLUSH_SIZE或距上次落库超过USAGE_FLUSH_INTERVAL秒
+        时合并为一次executemany提交，每个id一条+N更新，
+        避免每次缓存读取都附带一次写事务。
+        """
+        flush = None
+        with self._usage_lock:
+            self._usage_counts[translation_id] += 1
+            now = time.monotonic()
+            if (len(self._usage_counts) >= self.USAGE_FLUSH_SIZE
+                    or now - self._usage_last_flush >= self.USAGE_FLUSH_INTERVAL):
+                flush = self._usage_counts
+                self._usage_counts = Counter()
+                self._usage_last_flush = now
+
+        if flush:
+            self.execute_many(_Q_BUMP_TRANSLATION_USAGE,
+                              [(n, tid) for tid, n in flush.items()])
+
+    def flush_translation_usage(self) -> None:
+        """立即把缓冲中的使用计数增量落库（清理/关闭前调用）"""
+        with self._usage_lock:
+            flush = self._usage_counts
+            self._usage_counts = Counter()
+            self._usage_last_flush = time.monotonic()
+
+        if flush:
+            self.execute_many(_Q_BUMP_TRANSLATION_USAGE,
+                              [(n, tid) for tid, n in flush.items()])
+
     def cache_translation(self, source_text: str, target_language: str, translated_text: str,
                          translation_service: str = 'unknown', confidence_score: float = 1.0,
                          context_hash: Optional[str] = None) -> int:
-        """缓存翻译结果"""
+        """缓存翻译结果（UPSERT：冲突时原地更新并累加usage_count）"""
         query = '''
-            INSERT OR REPLACE INTO translation_cache
+            INSERT INTO translation_cache
             (source_text, target_language, translated_text, translation_service,
-             confidence_score, context_hash)
-            VALUES (?, ?, ?, ?, ?, ?)
+             confidence_score, context_hash, source_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(source_text, target_language, context_hash) DO UPDATE SET
+                translated_text = excluded.translated_text,
+                translation_service = excluded.translation_service,
+                confidence_score = excluded.confidence_score,
+                usage_count = usage_count + 1,
+                last_used = CURRENT_TIMESTAMP
+            RETURNING id
         '''
-        return self.execute_insert(query, (
+        row_id = self.execute_upsert(query, (
             source_text, target_language, translated_text,
-            translation_service, confidence_score, context_hash
+            translation_service, confidence_score, context_hash,
+            _source_hash(source_text)
         ))
+        self._cache_evict(self._tx_cache, (source_text, target_language, context_hash))
+        return row_id
+
+    def bulk_cache_translations(self, rows: Iterable[tuple]) -> int:
+        """
+        批量缓存翻译结果（单事务，适合预热缓存）
+
+        Args:
+            rows: (source_text, target_language, translated_text,
+                   translation_service, confidence_score, context_hash) 元组序列
+
+        Returns:
+            插入的行数
+        """
+        query = '''
+            INSERT INTO translation_cache
+            (source_text, target_language, translated_text, translation_service,
+             confidence_score, context_hash, source_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(source_text, target_language, context_hash) DO UPDATE SET
+                translated_text = excluded.translated_text,
+                translation_service = excluded.translation_service,
+                confidence_score = excluded.confidence_score,
+                last_used = CURRENT_TIMESTAMP
+        '''
+        return self.execute_many(
+            query, (tuple(row) + (_source_hash(row[0]),) for row in rows))
 
     # 阅读历史相关操作
     def update_reading_progress(self, user_id: int, article_id: int, progress: float,
                                reading_time: int = 0, words_looked_up: int = 0,
                                last_position: int = 0) -> None:
-        """更新阅读进度"""
+        """
+        更新阅读进度（写缓冲）
+
+        滚动阅读时同一文章的进度每次滚屏都会上报，逐条提交会产生大量
+        小写事务。这里只更新内存中的待写表（同键覆盖），由后台线程每
+        PROGRESS_FLUSH_INTERVAL秒合并为一次executemany UPSERT落库。
+        """
+        row = (user_id, article_id, progress, reading_time, words_looked_up, last_position)
+        with self._progress_lock:
+            self._pending_progress[(user_id, article_id)] = row
+            if self._progress_thread is None:
+                self._progress_thread = threading.Thread(
+                    target=self._progress_flush_loop,
+                    name='progress-flush', daemon=True)
+                self._progress_thread.start()
+
+    def _progress_flush_loop(self) -> None:
+        """后台线程：周期性把缓冲的阅读进度落库"""
+        while not self._progress_stop.wait(self.PROGRESS_FLUSH_INTERVAL):
+            self.flush_reading_progress()
+
+    def flush_reading_progress(self) -> None:
+        """立即把缓冲的阅读进度落库（读历史/标记完成/关闭前调用）"""
+        with self._progress_lock:
+            pending = self._pending_progress
+            self._pending_progress = {}
+
+        if pending:
+            self.execute_many(_Q_UPSERT_READING_PROGRESS, pending.values())
+
+    def bulk_update_reading_progress(self, rows: Iterable[tuple]) -> int:
+        """
+        批量更新阅读进度（单事务）
+
+        Args:
+            rows: (user_id, article_id, reading_progress, reading_time,
+                   words_looked_up, last_position) 元组序列
+
+        Returns:
+            受影响的行数
+        """
         query = '''
-            INSERT OR REPLACE INTO reading_history
+            INSERT INTO reading_history
             (user_id, article_id, reading_progress, reading_time, words_looked_up, last_position)
             VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(user_id, article_id) DO UPDATE SET
+                reading_progress = excluded.reading_progress,
+                reading_time = excluded.reading_time,
+                words_looked_up = excluded.words_looked_up,
+                last_position = excluded.last_position
         '''
-        self.execute_update(query, (user_id, article_id, progress, reading_time, words_looked_up, last_position))
+        return self.execute_many(query, rows)
 
-    def get_reading_history(self, user_id: int, limit: int = 20) -> List[Dict]:
-        """获取阅读历史"""
+    def get_reading_history(self, user_id: int, limit: int = 20,
+                            before: Optional[str] = None) -> List[Dict]:
+        """获取阅读历史
+
+        before: 键集分页游标（上一页最后一条的started_at），
+        命中索引(user_id, started_at DESC)，用法同get_user_vocabulary。
+        """
+        self.flush_reading_progress()  # 保证读到刚上报的进度
+        if before is not None:
+            query = '''
+                SELECT rh.*, a.title, a.difficulty_level
+                FROM reading_history rh
+                JOIN articles a ON rh.article_id = a.id
+                WHERE rh.user_id = ? AND rh.started_at < ?
+                ORDER BY rh.started_at DESC
+                LIMIT ?
+            '''
+            return self.execute_query(query, (user_id, before, limit))
         query = '''
             SELECT rh.*, a.title, a.difficulty_level
             FROM reading_history rh
@@ -297,24 +982,36 @@ class DatabaseManager:
     def mark_article_completed(self, user_id: int, article_id: int,
                               comprehension_score: Optional[float] = None) -> None:
         """标记文章为已完成"""
+        self.flush_reading_progress()  # 先落库缓冲的进度，避免稍后被旧进度覆盖
+        # UPSERT：无进度记录直接标记完成时也能落一行，不再静默丢失
         query = '''
-            UPDATE reading_history
-            SET completed = TRUE, completed_at = CURRENT_TIMESTAMP, comprehension_score = ?
-            WHERE user_id = ? AND article_id = ?
+            INSERT INTO reading_history
+            (user_id, article_id, completed, completed_at, comprehension_score)
+            VALUES (?, ?, TRUE, CURRENT_TIMESTAMP, ?)
+            ON CONFLICT(user_id, article_id) DO UPDATE SET
+                completed = TRUE,
+                completed_at = CURRENT_TIMESTAMP,
+                comprehension_score = excluded.comprehension_score
         '''
-        self.execute_update(query, (comprehension_score, user_id, article_id))
+        self.execute_update(query, (user_id, article_id, comprehension_score))
 
     # 学习统计相关操作
     def update_daily_stats(self, user_id: int, words_learned: int = 0, articles_read: int = 0,
                           reading_time: int = 0, vocabulary_reviewed: int = 0,
                           accuracy_rate: float = 0.0) -> None:
-        """更新每日学习统计"""
+        """更新每日学习统计（UPSERT：原地覆盖当日数值）"""
         today = date.today()
         query = '''
-            INSERT OR REPLACE INTO learning_stats
+            INSERT INTO learning_stats
             (user_id, date, words_learned, articles_read, reading_time,
              vocabulary_reviewed, accuracy_rate)
             VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(user_id, date) DO UPDATE SET
+                words_learned = excluded.words_learned,
+                articles_read = excluded.articles_read,
+                reading_time = excluded.reading_time,
+                vocabulary_reviewed = excluded.vocabulary_reviewed,
+                accuracy_rate = excluded.accuracy_rate
         '''
         self.execute_update(query, (
             user_id, today, words_learned, articles_read,
@@ -323,42 +1020,113 @@ class DatabaseManager:
 
     def get_user_stats(self, user_id: int, days: int = 30) -> List[Dict]:
         """获取用户学习统计"""
-        # 验证days参数为正整数，防止SQL注入
         if not isinstance(days, int) or days <= 0:
             days = 30
+        # 截止日期在Python侧计算：SQL文本恒定，绑定值为单个参数
+        cutoff = (date.today() - timedelta(days=days)).isoformat()
         query = '''
             SELECT * FROM learning_stats
-            WHERE user_id = ? AND date >= date('now', '-' || ? || ' days')
+            WHERE user_id = ? AND date >= ?
             ORDER BY date DESC
         '''
-        return self.execute_query(query, (user_id, str(days)))
+        return self.execute_query(query, (user_id, cutoff))
+
+    def get_user_dashboard(self, user_id: int, vocab_limit: int = 10,
+                           history_limit: int = 10) -> Dict[str, Any]:
+        """一次调用取齐仪表盘数据（生词、阅读历史、学习统计、摘要）
+
+        四块数据在同一个读事务快照内取出：单次加锁、相互一致，
+        /api/stats这类聚合端点不必发四次独立调用各自抢锁。
+        """
+        self.flush_reading_progress()  # 进入只读事务前落库缓冲的进度
+        history_query = '''
+            SELECT rh.*, a.title, a.difficulty_level
+            FROM reading_history rh
+            JOIN articles a ON rh.article_id = a.id
+            WHERE rh.user_id = ?
+            ORDER BY rh.started_at DESC
+            LIMIT ?
+        '''
+        with self.get_connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                dashboard = {
+                    'vocabulary': self.get_user_vocabulary(user_id, vocab_limit),
+                    'reading_history': self.execute_query(
+                        history_query, (user_id, history_limit)),
+                    'learning_stats': self.get_user_stats(user_id),
+                    'summary': self.get_learning_stats_summary(user_id),
+                }
+            finally:
+                conn.commit()
+        return dashboard
 
     # 数据库维护
     def cleanup_old_cache(self, days: int = 30) -> int:
         """清理旧的翻译缓存"""
-        # 验证days参数为正整数，防止SQL注入
         if not isinstance(days, int) or days <= 0:
             days = 30
+        # 先落库缓冲的使用计数，避免误删刚被命中的usage_count=1行
+        self.flush_translation_usage()
+        cutoff = (date.today() - timedelta(days=days)).isoformat()
         query = '''
             DELETE FROM translation_cache
-            WHERE last_used < date('now', '-' || ? || ' days') AND usage_count = 1
+            WHERE last_used < ? AND usage_count = 1
         '''
-        return self.execute_update(query, (str(days),))
+        deleted = self.execute_update(query, (cutoff,))
+        if deleted:
+            # 增量归还空页（上限1000页），避免整库VACUUM的停顿
+            with self.get_connection() as conn:
+                conn.execute("PRAGMA incremental_vacuum(1000)")
+        return deleted
+
+    def enforce_cache_size_limit(self, max_size: Optional[int] = None) -> int:
+        """把翻译缓存裁剪到容量上限内（LRU淘汰）
+
+        按last_used升序删掉最旧的超额部分，命中idx_trans_lastused索引，
+        只扫描需淘汰的行数。上限默认取CACHE_CONFIG['max_cache_size']，
+        适合与cleanup_old_cache一起放在定时维护任务里。
+        """
+        if max_size is None:
+            max_size = CACHE_CONFIG['max_cache_size']
+        self.flush_translation_usage()
+        total = self.fetch_scalar("SELECT COUNT(*) FROM translation_cache") or 0
+        excess = total - max_size
+        if excess <= 0:
+            return 0
+        query = '''
+            DELETE FROM translation_cache
+            WHERE id IN (
+                SELECT id FROM translation_cache
+                ORDER BY last_used ASC
+                LIMIT ?
+            )
+        '''
+        return self.execute_update(query, (excess,))
 
-    def get_database_stats(self) -> Dict[str, int]:
-        """获取数据库统计信息"""
-        # 使用白名单验证表名，防止SQL注入
-        allowed_tables = {'users', 'articles', 'vocabulary', 'translation_cache',
-                         'reading_history', 'learning_stats', 'learning_sessions'}
+    def compact(self) -> None:
+        """整库VACUUM压缩（会重写整个文件，应在离峰维护任务中调用）"""
+        with self.get_connection() as conn:
+            conn.execute("VACUUM")
 
-        stats = {}
-        for table in allowed_tables:
-            # 表名已通过白名单验证，可以安全使用
-            query = f"SELECT COUNT(*) as count FROM {table}"
-            result = self.execute_query(query)
-            stats[table] = result[0]['count'] if result else 0
+    def get_database_stats(self) -> Dict[str, int]:
+        """获取数据库统计信息（单条UNION ALL查询，避免逐表往返）
 
-        return stats
+        SQLite的COUNT(*)没有预存行数、永远是全表扫描，故结果按
+        数据版本缓存：data_version捕捉其他连接的提交、total_changes
+        捕捉本连接的写入，两者都没变时直接返回上次的结果。
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            data_version = cursor.execute("PRAGMA data_version").fetchone()[0]
+            version = (data_version, conn.total_changes)
+            cached = getattr(self._local, 'stats_cache', None)
+            if cached is not None and cached[0] == version:
+                return dict(cached[1])
+        stats = {row[0]: row[1] for row in self.execute_query(_Q_DATABASE_STATS)}
+        self._local.stats_cache = (version, stats)
+        return dict(stats)
 
     # ============================================
     # 间隔重复学习系统相关操作
@@ -414,34 +1182,42 @@ class DatabaseManager:
             consecutive_correct: 连续正确次数
             correct: 本次是否回答正确
         """
-        query = '''
-            UPDATE vocabulary
-            SET next_review = ?,
-                ease_factor = ?,
-                interval_days = ?,
-                mastery_level = ?,
-                consecutive_correct = ?,
-                last_reviewed = CURRENT_TIMESTAMP,
-                review_count = review_count + 1,
-                correct_count = correct_count + ?
-            WHERE id = ?
-        '''
-        self.execute_update(query, (
+        self.execute_update(_Q_UPDATE_VOCAB_REVIEW, (
             next_review, ease_factor, interval_days,
             mastery_level, consecutive_correct,
             1 if correct else 0, vocab_id
         ))
 
+    def update_vocabulary_reviews_bulk(self, reviews: Iterable[Dict]) -> int:
+        """批量提交复习结果（一次学习会话结束时调用）
+
+        reviews: 字典迭代器，键同update_vocabulary_review的参数
+        （vocab_id, next_review, ease_factor, interval_days,
+        mastery_level, consecutive_correct, correct）。
+        executemany只prepare一次SQL，且全部更新落在同一个事务里，
+        N个单词只fsync一次，而逐条调用要提交N次。
+        """
+        params = [
+            (r['next_review'], r['ease_factor'], r['interval_days'],
+             r['mastery_level'], r['consecutive_correct'],
+             1 if r['correct'] else 0, r['vocab_id'])
+            for r in reviews
+        ]
+        if not params:
+            return 0
+        with self.transaction() as conn:
+            cursor = conn.executemany(_Q_UPDATE_VOCAB_REVIEW, params)
+            return cursor.rowcount
+
     def get_due_review_count(self, user_id: int) -> int:
         """获取待复习单词数量"""
         query = '''
-            SELECT COUNT(*) as count
+            SELECT COUNT(*)
             FROM vocabulary
             WHERE user_id = ?
             AND (next_review IS NULL OR next_review <= datetime('now'))
         '''
-        result = self.execute_query(query, (user_id,))
-        return result[0]['count'] if result else 0
+        return self.fetch_scalar(query, (user_id,)) or 0
 
     def get_mastery_distribution(self, user_id: int) -> Dict[int, int]:
         """获取掌握程度分布"""
@@ -462,83 +1238,88 @@ class DatabaseManager:
         Returns:
             包含今日统计、掌握程度分布、待复习数量等信息
         """
-        # 今日统计
-        today_query = '''
-            SELECT
-                COALESCE(SUM(words_learned), 0) as words_learned,
-                COALESCE(SUM(vocabulary_reviewed), 0) as vocabulary_reviewed,
-                COALESCE(AVG(accuracy_rate), 0) as accuracy_rate,
-                COALESCE(SUM(reading_time), 0) as reading_time
+        # 今日统计、待复习数量和掌握程度分布合并为一条带标签列的
+        # UNION ALL查询，一次往返拿到全部摘要数据
+        query = '''
+            SELECT 'today' AS kind, 0 AS level,
+                   COALESCE(SUM(words_learned), 0) AS v1,
+                   COALESCE(SUM(vocabulary_reviewed), 0) AS v2,
+                   COALESCE(AVG(accuracy_rate), 0) AS v3,
+                   COALESCE(SUM(reading_time), 0) AS v4
             FROM learning_stats
             WHERE user_id = ? AND date = date('now')
+            UNION ALL
+            SELECT 'due', 0, COUNT(*), 0, 0, 0
+            FROM vocabulary
+            WHERE user_id = ?
+            AND (next_review IS NULL OR next_review <= datetime('now'))
+            UNION ALL
+            SELECT 'mastery', mastery_level, COUNT(*), 0, 0, 0
+            FROM vocabulary
+            WHERE user_id = ?
+            GROUP BY mastery_level
         '''
-        today_result = self.execute_query(today_query, (user_id,))
-        today = today_result[0] if today_result else {
-            'words_learned': 0,
-            'vocabulary_reviewed': 0,
-            'accuracy_rate': 0,
-            'reading_time': 0
-        }
-
-        # 掌握程度分布
-        mastery = self.get_mastery_distribution(user_id)
-
-        # 待复习数量
-        due_count = self.get_due_review_count(user_id)
-
-        # 连续学习天数
-        streak = self.get_learning_streak(user_id)
+        rows = self.execute_query(query, (user_id, user_id, user_id))
+
+        today = {'words_learned': 0, 'vocabulary_reviewed': 0,
+                 'accuracy_rate': 0, 'reading_time': 0}
+        mastery: Dict[int, int] = {}
+        due_count = 0
+        for row in rows:
+            if row['kind'] == 'today':
+                today = {'words_learned': row['v1'], 'vocabulary_reviewed': row['v2'],
+                         'accuracy_rate': row['v3'], 'reading_time': row['v4']}
+            elif row['kind'] == 'due':
+                due_count = row['v1']
+            else:
+                mastery[row['level']] = row['v1']
 
         return {
             'today': today,
             'mastery_distribution': mastery,
             'due_for_review': due_count,
-            'streak_days': streak
+            'streak_days': self.get_learning_streak(user_id)
         }
 
     def get_learning_streak(self, user_id: int) -> int:
-        """计算连续学习天数"""
+        """
+        计算连续学习天数
+
+        用递归CTE从今天向前逐日回溯，遇到无学习记录的日期即停止；
+        只返回一个整数，不再把全部学习日期拉回Python逐行比对。
+        起点用Python侧的date.today()绑定——写入方increment_daily_stats
+        记的是本地日期，SQL里的date('now')按UTC算，非UTC时区下
+        每天会有一段时间差一天。
+        """
         query = '''
-            SELECT date FROM learning_stats
-            WHERE user_id = ?
-            AND (words_learned > 0 OR vocabulary_reviewed > 0)
-            ORDER BY date DESC
+            WITH RECURSIVE streak(d, n) AS (
+                SELECT ?, 0
+                UNION ALL
+                SELECT date(d, '-1 day'), n + 1
+                FROM streak
+                WHERE EXISTS (
+                    SELECT 1 FROM learning_stats
+                    WHERE user_id = ? AND date = streak.d
+                    AND (words_learned > 0 OR vocabulary_reviewed > 0)
+                )
+            )
+            SELECT COALESCE(MAX(n), 0) FROM streak
         '''
-        results = self.execute_query(query, (user_id,))
-
-        if not results:
-            return 0
-
-        streak = 0
-        today = date.today()
-
-        for i, row in enumerate(results):
-            # 解析日期字符串
-            if isinstance(row['date'], str):
-                row_date = datetime.strptime(row['date'], '%Y-%m-%d').date()
-            else:
-                row_date = row['date']
-
-            expected_date = today - timedelta(days=i)
-
-            if row_date == expected_date:
-                streak += 1
-            else:
-                break
-
-        return streak
+        return self.fetch_scalar(
+            query, (date.today().isoformat(), user_id)) or 0
 
     def get_weekly_trend(self, user_id: int, days: int = 7) -> List[Dict]:
         """获取学习趋势数据"""
         if not isinstance(days, int) or days <= 0:
             days = 7
+        cutoff = (date.today() - timedelta(days=days)).isoformat()
         query = '''
             SELECT date, words_learned, vocabulary_reviewed, accuracy_rate
             FROM learning_stats
-            WHERE user_id = ? AND date >= date('now', '-' || ? || ' days')
+            WHERE user_id = ? AND date >= ?
             ORDER BY date ASC
         '''
-        return self.execute_query(query, (user_id, str(days)))
+        return self.execute_query(query, (user_id, cutoff))
 
     # 学习会话相关操作
     def create_learning_session(self, user_id: int, session_type: str) -> int:
@@ -593,47 +1374,32 @@ class DatabaseManager:
         """
         增量更新每日学习统计
 
-        如果今日记录不存在则创建，存在则累加
+        单条原子UPSERT：不存在则创建，存在则在SQL内累加并按复习量
+        加权合并准确率，消除先查后写的竞态窗口和两次往返。
         """
         today = date.today()
 
-        # 计算准确率
+        # 计算本次准确率
         accuracy = (correct_count / total_count * 100) if total_count > 0 else 0
 
-        # 检查今日记录是否存在
-        check_query = '''
-            SELECT id, words_learned, vocabulary_reviewed, accuracy_rate
-            FROM learning_stats
-            WHERE user_id = ? AND date = ?
+        query = '''
+            INSERT INTO learning_stats
+            (user_id, date, words_learned, vocabulary_reviewed, accuracy_rate)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(user_id, date) DO UPDATE SET
+                words_learned = words_learned + excluded.words_learned,
+                accuracy_rate = CASE
+                    WHEN vocabulary_reviewed + ? > 0
+                    THEN (accuracy_rate * vocabulary_reviewed + ? * ?)
+                         / (vocabulary_reviewed + ?)
+                    ELSE 0
+                END,
+                vocabulary_reviewed = vocabulary_reviewed + excluded.vocabulary_reviewed
         '''
-        existing = self.execute_query(check_query, (user_id, today))
-
-        if existing:
-            # 更新现有记录
-            record = existing[0]
-            new_words = record['words_learned'] + words_learned
-            new_reviewed = record['vocabulary_reviewed'] + vocabulary_reviewed
-            # 计算加权平均准确率
-            old_total = record['vocabulary_reviewed']
-            new_total = old_total + total_count
-            if new_total > 0:
-                new_accuracy = (record['accuracy_rate'] * old_total + accuracy * total_count) / new_total
-            else:
-                new_accuracy = 0
-
-            update_query = '''
-                UPDATE learning_stats
-                SET words_learned = ?, vocabulary_reviewed = ?, accuracy_rate = ?
-                WHERE id = ?
-            '''
-            self.execute_update(update_query, (new_words, new_reviewed, new_accuracy, record['id']))
-        else:
-            # 创建新记录
-            insert_query = '''
-                INSERT INTO learning_stats (user_id, date, words_learned, vocabulary_reviewed, accuracy_rate)
-                VALUES (?, ?, ?, ?, ?)
-            '''
-            self.execute_insert(insert_query, (user_id, today, words_learned, vocabulary_reviewed, accuracy))
+        self.execute_update(query, (
+            user_id, today, words_learned, vocabulary_reviewed, accuracy,
+            total_count, accuracy, total_count, total_count
+        ))
 
     # ============================================
     # 词典系统相关操作
@@ -675,13 +1441,13 @@ class DatabaseManager:
     def get_dictionary_by_id(self, dictionary_id: int) -> Optional[Dict]:
         """根据ID获取词典"""
         query = "SELECT * FROM dictionaries WHERE id = ?"
-        results = self.execute_query(query, (dictionary_id,))
+        results = self.execute_query_as_dict(query, (dictionary_id,))
         return results[0] if results else None
 
     def get_dictionary_by_name(self, name: str) -> Optional[Dict]:
         """根据名称获取词典"""
         query = "SELECT * FROM dictionaries WHERE name = ?"
-        results = self.execute_query(query, (name,))
+        results = self.execute_query_as_dict(query, (name,))
         return results[0] if results else None
 
     def get_all_dictionaries(self, enabled_only: bool = False) -> List[Dict]:
@@ -705,7 +1471,7 @@ class DatabaseManager:
                 SELECT * FROM dictionaries
                 ORDER BY priority ASC, created_at ASC
             '''
-        return self.execute_query(query)
+        return self.execute_query_as_dict(query)
 
     def update_dictionary(self, dictionary_id: int, **kwargs) -> int:
         """
@@ -829,13 +1595,13 @@ class DatabaseManager:
         '''
         return self.execute_insert(query, tuple(values))
 
-    def add_dictionary_entries_batch(self, dictionary_id: int, entries: List[Dict]) -> int:
+    def add_dictionary_entries_batch(self, dictionary_id: int, entries: List[Any]) -> int:
         """
         批量添加词条（优化性能）
 
         Args:
             dictionary_id: 词典ID
-            entries: 词条列表，每个词条是一个字典
+            entries: DictionaryEntry对象列表（按属性读取，见dictionary_parser）
 
         Returns:
             插入的词条数
@@ -846,7 +1612,7 @@ class DatabaseManager:
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
-            # 准备批量插入
+            # 准备批量插入（列顺序与DictionaryEntry.to_row一致）
             query = '''
                 INSERT INTO dictionary_entries
                 (dictionary_id, word, word_lower, translation, phonetic_uk, phonetic_us,
@@ -855,47 +1621,7 @@ class DatabaseManager:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             '''
 
-            batch_data = []
-            for entry in entries:
-                word = entry.get('word', '')
-                translation = entry.get('translation', '')
-
-                # 处理JSON字段
-                pos = entry.get('pos')
-                if isinstance(pos, (list, dict)):
-                    pos = json.dumps(pos, ensure_ascii=False)
-
-                exchange = entry.get('exchange')
-                if isinstance(exchange, (list, dict)):
-                    exchange = json.dumps(exchange, ensure_ascii=False)
-
-                examples = entry.get('examples')
-                if isinstance(examples, (list, dict)):
-                    examples = json.dumps(examples, ensure_ascii=False)
-
-                tags = entry.get('tags')
-                if isinstance(tags, (list, dict)):
-                    tags = json.dumps(tags, ensure_ascii=False)
-
-                batch_data.append((
-                    dictionary_id,
-                    word,
-                    word.lower(),
-                    translation,
-                    entry.get('phonetic_uk'),
-                    entry.get('phonetic_us'),
-                    pos,
-                    entry.get('definition'),
-                    exchange,
-                    examples,
-                    tags,
-                    entry.get('frequency'),
-                    entry.get('collins_star'),
-                    entry.get('oxford_level'),
-                    entry.get('bnc_rank'),
-                    entry.get('frq_rank')
-                ))
-
+            batch_data = [entry.to_row(dictionary_id) for entry in entries]
             cursor.executemany(query, batch_data)
             conn.commit()
             return len(batch_data)
@@ -937,7 +1663,7 @@ class DatabaseManager:
             '''
             params = [word_lower]
 
-        results = self.execute_query(query, tuple(params))
+        results = self.execute_query_as_dict(query, tuple(params))
 
         # 解析JSON字段
         for entry in results:
@@ -992,13 +1718,12 @@ class DatabaseManager:
             '''
             params = [pattern, limit]
 
-        return self.execute_query(query, tuple(params))
+        return self.execute_query_as_dict(query, tuple(params))
 
     def get_dictionary_entry_count(self, dictionary_id: int) -> int:
         """获取词典词条数量"""
-        query = "SELECT COUNT(*) as count FROM dictionary_entries WHERE dictionary_id = ?"
-        result = self.execute_query(query, (dictionary_id,))
-        return result[0]['count'] if result else 0
+        query = "SELECT COUNT(*) FROM dictionary_entries WHERE dictionary_id = ?"
+        return self.fetch_scalar(query, (dictionary_id,)) or 0
 
     def delete_dictionary_entries(self, dictionary_id: int) -> int:
         """删除词典的所有词条"""
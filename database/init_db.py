@@ -9,10 +9,24 @@ import sqlite3
 import os
 from pathlib import Path
 
+from config import DATABASE_CONFIG
+
 # 数据库配置
 DB_NAME = "english_reading.db"
 SCHEMA_FILE = "schema.sql"
 
+
+def _connect(db_path) -> sqlite3.Connection:
+    """打开连接并应用与db_manager一致的PRAGMA
+
+    journal_mode/auto_vacuum是持久化设置，在建库时就写入文件头，
+    保证之后任何客户端打开都处于WAL+增量回收模式。
+    """
+    conn = sqlite3.connect(db_path)
+    for pragma, value in DATABASE_CONFIG['sqlite'].get('pragmas', {}).items():
+        conn.execute(f"PRAGMA {pragma}={value}")
+    return conn
+
 def init_database():
     """初始化数据库"""
     # 获取当前脚本所在目录
@@ -29,16 +43,21 @@ def init_database():
 
     try:
         # 连接数据库（如果不存在会自动创建）
-        conn = sqlite3.connect(db_path)
+        conn = _connect(db_path)
         cursor = conn.cursor()
 
         # 读取并执行schema.sql
         with open(schema_path, 'r', encoding='utf-8') as f:
             schema_sql = f.read()
 
-        # 执行SQL语句
+        # 建库加速：新库无数据可保护，DDL期间关闭日志和fsync，
+        # 几十条CREATE只fsync一次；建完恢复WAL+NORMAL（持久化到文件头）
+        cursor.execute("PRAGMA journal_mode=OFF")
+        cursor.execute("PRAGMA synchronous=OFF")
         cursor.executescript(schema_sql)
         conn.commit()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
 
         print("数据库初始化成功")
 
@@ -87,7 +106,7 @@ def check_database():
         return False
 
     try:
-        conn = sqlite3.connect(db_path)
+        conn = _connect(db_path)
         cursor = conn.cursor()
 
         # 检查表
@@ -127,7 +146,7 @@ def insert_sample_data():
     db_path = current_dir / DB_NAME
 
     try:
-        conn = sqlite3.connect(db_path)
+        conn = _connect(db_path)
         cursor = conn.cursor()
 
         # 插入示例文章
@@ -156,17 +175,18 @@ def insert_sample_data():
             }
         ]
 
-        for article in sample_articles:
-            cursor.execute('''
-                INSERT INTO articles (title, content, author, difficulty_level, word_count,
-                                    sentence_count, flesch_score, category, tags)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                article['title'], article['content'], article['author'],
-                article['difficulty_level'], article['word_count'],
-                article['sentence_count'], article['flesch_score'],
-                article['category'], article['tags']
-            ))
+        # executemany：一次prepare、单事务批量插入
+        cursor.executemany('''
+            INSERT INTO articles (title, content, author, difficulty_level, word_count,
+                                sentence_count, flesch_score, category, tags)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', [
+            (article['title'], article['content'], article['author'],
+             article['difficulty_level'], article['word_count'],
+             article['sentence_count'], article['flesch_score'],
+             article['category'], article['tags'])
+            for article in sample_articles
+        ])
 
         # 插入示例翻译缓存
         sample_translations = [
@@ -176,12 +196,11 @@ def insert_sample_data():
             ('climate change', 'zh', '气候变化', 'local_dict', 0.95)
         ]
 
-        for trans in sample_translations:
-            cursor.execute('''
-                INSERT OR IGNORE INTO translation_cache
-                (source_text, target_language, translated_text, translation_service, confidence_score)
-                VALUES (?, ?, ?, ?, ?)
-            ''', trans)
+        cursor.executemany('''
+            INSERT OR IGNORE INTO translation_cache
+            (source_text, target_language, translated_text, translation_service, confidence_score)
+            VALUES (?, ?, ?, ?, ?)
+        ''', sample_translations)
 
         conn.commit()
         conn.close()
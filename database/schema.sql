@@ -10,7 +10,7 @@ CREATE TABLE IF NOT EXISTS users (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     last_login DATETIME,
-    preferences TEXT, -- JSON格式存储用户偏好设置
+    preferences JSON, -- JSON格式存储用户偏好设置（由db_manager的类型转换器自动编解码）
     reading_level VARCHAR(20) DEFAULT 'intermediate' -- beginner, intermediate, advanced
 );
 
@@ -28,7 +28,7 @@ CREATE TABLE IF NOT EXISTS articles (
     flesch_score REAL, -- Flesch Reading Ease分数
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    tags TEXT, -- JSON格式存储标签
+    tags JSON, -- JSON格式存储标签（由db_manager的类型转换器自动编解码）
     category VARCHAR(50),
     language VARCHAR(10) DEFAULT 'en'
 );
@@ -73,6 +73,7 @@ CREATE TABLE IF NOT EXISTS translation_cache (
     usage_count INTEGER DEFAULT 1,
     last_used DATETIME DEFAULT CURRENT_TIMESTAMP,
     context_hash VARCHAR(64), -- 上下文哈希，用于上下文相关翻译
+    source_hash INTEGER, -- source_text的64位哈希，由db_manager写入，加速等值查找
     UNIQUE(source_text, target_language, context_hash)
 );
 
@@ -132,18 +133,48 @@ CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
 CREATE INDEX IF NOT EXISTS idx_articles_difficulty ON articles(difficulty_level);
 CREATE INDEX IF NOT EXISTS idx_articles_category ON articles(category);
 CREATE INDEX IF NOT EXISTS idx_articles_created_at ON articles(created_at);
+CREATE INDEX IF NOT EXISTS idx_articles_diff_created ON articles(difficulty_level, created_at DESC);
+
+-- 文章全文搜索（FTS5外部内容表，经触发器与articles保持同步）
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, content,
+    content='articles',
+    content_rowid='id',
+    tokenize='porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, content)
+    VALUES ('delete', old.id, old.title, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, content)
+    VALUES ('delete', old.id, old.title, old.content);
+    INSERT INTO articles_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
 
 CREATE INDEX IF NOT EXISTS idx_vocabulary_user_id ON vocabulary(user_id);
 CREATE INDEX IF NOT EXISTS idx_vocabulary_word ON vocabulary(word);
 CREATE INDEX IF NOT EXISTS idx_vocabulary_mastery ON vocabulary(mastery_level);
 CREATE INDEX IF NOT EXISTS idx_vocabulary_last_reviewed ON vocabulary(last_reviewed);
+CREATE INDEX IF NOT EXISTS idx_vocabulary_user_first ON vocabulary(user_id, first_encountered DESC);
 
 CREATE INDEX IF NOT EXISTS idx_translation_cache_source ON translation_cache(source_text);
 CREATE INDEX IF NOT EXISTS idx_translation_cache_created_at ON translation_cache(created_at);
+-- LRU容量淘汰用（db_manager.enforce_cache_size_limit 按 last_used 升序裁剪）
+CREATE INDEX IF NOT EXISTS idx_trans_lastused ON translation_cache(last_used);
+-- 整数哈希查找路径（db_manager.get_translation 先按source_hash定位再复核原文）
+CREATE INDEX IF NOT EXISTS idx_trcache_lookup ON translation_cache(source_hash, target_language, context_hash);
 
 CREATE INDEX IF NOT EXISTS idx_reading_history_user_id ON reading_history(user_id);
 CREATE INDEX IF NOT EXISTS idx_reading_history_article_id ON reading_history(article_id);
 CREATE INDEX IF NOT EXISTS idx_reading_history_started_at ON reading_history(started_at);
+CREATE INDEX IF NOT EXISTS idx_reading_history_user_started ON reading_history(user_id, started_at DESC);
 
 CREATE INDEX IF NOT EXISTS idx_learning_stats_user_date ON learning_stats(user_id, date);
 
@@ -151,6 +182,10 @@ CREATE INDEX IF NOT EXISTS idx_learning_stats_user_date ON learning_stats(user_i
 CREATE INDEX IF NOT EXISTS idx_vocabulary_next_review ON vocabulary(next_review);
 CREATE INDEX IF NOT EXISTS idx_vocabulary_user_next_review ON vocabulary(user_id, next_review);
 CREATE INDEX IF NOT EXISTS idx_vocabulary_user_mastery ON vocabulary(user_id, mastery_level);
+-- 复习选词：过滤+排序全部走索引（get_words_for_review）
+CREATE INDEX IF NOT EXISTS idx_vocab_review ON vocabulary(user_id, next_review, mastery_level);
+-- 新词选取：review_count=0过滤后按首见时间倒序（get_new_words_for_learning）
+CREATE INDEX IF NOT EXISTS idx_vocab_user_reviewcount ON vocabulary(user_id, review_count, first_encountered DESC);
 CREATE INDEX IF NOT EXISTS idx_learning_sessions_user ON learning_sessions(user_id);
 CREATE INDEX IF NOT EXISTS idx_learning_sessions_date ON learning_sessions(started_at);
 CREATE INDEX IF NOT EXISTS idx_learning_sessions_user_date ON learning_sessions(user_id, started_at);
@@ -16,8 +16,13 @@ def init_database():
         with open(schema_path, 'r', encoding='utf-8') as f:
             schema_sql = f.read()
 
+        # 建库加速：DDL期间关闭日志和fsync，建完恢复WAL（同init_db）
+        cursor.execute("PRAGMA journal_mode=OFF")
+        cursor.execute("PRAGMA synchronous=OFF")
         cursor.executescript(schema_sql)
         conn.commit()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
 
         print("数据库初始化成功")
 
@@ -11,11 +11,18 @@ import tempfile
 from datetime import date
 
 class TestResult:
-    """测试结果统计"""
+    """测试结果统计
+
+    名称和原因存为两个并行列表（SoA），汇总时才拼接字符串；
+    __slots__省掉实例字典，大批量跑用例时开销更低。
+    """
+    __slots__ = ('passed', 'failed', '_names', '_reasons')
+
     def __init__(self):
         self.passed = 0
         self.failed = 0
-        self.errors = []
+        self._names = []
+        self._reasons = []
 
     def add_pass(self, test_name: str):
         self.passed += 1
@@ -23,17 +30,18 @@ class TestResult:
 
     def add_fail(self, test_name: str, reason: str):
         self.failed += 1
-        self.errors.append(f"{test_name}: {reason}")
+        self._names.append(test_name)
+        self._reasons.append(reason)
         print(f"  ✗ {test_name}: {reason}")
 
     def summary(self):
         total = self.passed + self.failed
         print(f"\n{'='*50}")
         print(f"测试结果: {self.passed}/{total} 通过")
-        if self.errors:
+        if self._names:
             print("\n失败的测试:")
-            for error in self.errors:
-                print(f"  - {error}")
+            for name, reason in zip(self._names, self._reasons):
+                print(f"  - {name}: {reason}")
         return self.failed == 0
 
 
@@ -444,21 +452,22 @@ def run_all_tests():
     db = DatabaseManager()
     result = TestResult()
 
-    # 运行测试
-    test_database_connection(db, result)
-    user_id = test_user_crud(db, result)
-    article_id = test_article_crud(db, result)
+    # 运行测试（整体包进bulk()：几十次写操作合并为一次提交/fsync）
+    with db.bulk():
+        test_database_connection(db, result)
+        user_id = test_user_crud(db, result)
+        article_id = test_article_crud(db, result)
 
-    if user_id:
-        test_vocabulary_crud(db, result, user_id)
-        test_learning_stats(db, result, user_id)
+        if user_id:
+            test_vocabulary_crud(db, result, user_id)
+            test_learning_stats(db, result, user_id)
 
-    if user_id and article_id:
-        test_reading_history(db, result, user_id, article_id)
+        if user_id and article_id:
+            test_reading_history(db, result, user_id, article_id)
 
-    test_translation_cache(db, result)
-    test_boundary_conditions(db, result)
-    test_database_stats(db, result)
+        test_translation_cache(db, result)
+        test_boundary_conditions(db, result)
+        test_database_stats(db, result)
 
     # 输出结果
     success = result.summary()